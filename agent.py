@@ -11,6 +11,8 @@ Provides:
 from __future__ import annotations
 
 import json
+import re
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Dict, List, Optional, Tuple
@@ -179,12 +181,10 @@ class BehaviorAgent:
             calls = self.storage.query(has_exception=True, limit=50)
         
         # Cluster errors by type
-        error_clusters: Dict[str, List[CapturedCall]] = {}
+        error_clusters: Dict[str, List[CapturedCall]] = defaultdict(list)
         for call in calls:
             if call.exception:
                 error_type = call.exception.get("type", "Unknown")
-                if error_type not in error_clusters:
-                    error_clusters[error_type] = []
                 error_clusters[error_type].append(call)
         
         return {
@@ -332,7 +332,6 @@ class BehaviorAgent:
     def _extract_function_name(self, question: str) -> Optional[str]:
         """Extract a function name from a question if present."""
         # Look for quoted strings
-        import re
         quoted = re.findall(r'["\']([^"\']+)["\']', question)
         if quoted:
             return quoted[0]
@@ -390,9 +389,8 @@ class BehaviorAgent:
         hash_counts: Dict[str, Tuple[int, Dict]] = {}
         for call in calls:
             h = call.input_hash
-            if h not in hash_counts:
-                hash_counts[h] = (0, call.args)
-            hash_counts[h] = (hash_counts[h][0] + 1, hash_counts[h][1])
+            count, example = hash_counts.get(h, (0, call.args))
+            hash_counts[h] = (count + 1, example)
         
         common_inputs = sorted(
             [{"hash": h, "count": count, "example": args} for h, (count, args) in hash_counts.items()],
@@ -405,9 +403,8 @@ class BehaviorAgent:
         for call in calls:
             if call.result is not None:
                 result_str = json.dumps(call.result, sort_keys=True, default=str)[:100]
-                if result_str not in output_counts:
-                    output_counts[result_str] = (0, call.result)
-                output_counts[result_str] = (output_counts[result_str][0] + 1, output_counts[result_str][1])
+                count, example = output_counts.get(result_str, (0, call.result))
+                output_counts[result_str] = (count + 1, example)
         
         common_outputs = sorted(
             [{"hash": h, "count": count, "example": result} for h, (count, result) in output_counts.items()],
@@ -420,9 +417,8 @@ class BehaviorAgent:
         for call in error_calls:
             if call.exception:
                 error_type = call.exception.get("type", "Unknown")
-                if error_type not in error_type_counts:
-                    error_type_counts[error_type] = (0, call.exception)
-                error_type_counts[error_type] = (error_type_counts[error_type][0] + 1, error_type_counts[error_type][1])
+                count, example = error_type_counts.get(error_type, (0, call.exception))
+                error_type_counts[error_type] = (count + 1, example)
         
         error_patterns = [
             {"type": t, "count": count, "example": exc}
@@ -295,6 +295,34 @@ def create_task(request: TaskCreateRequest) -> TaskResponse:
     return TaskResponse(**task.to_dict())
 
 
+@app.post("/tasks/bulk", response_model=List[TaskResponse], tags=["Tasks"])
+@capture
+def create_tasks_bulk(requests: List[TaskCreateRequest]) -> List[TaskResponse]:
+    """Create multiple tasks in a single transaction."""
+    _maybe_inject_error("create_tasks_bulk")
+
+    task_creates = []
+    for request in requests:
+        try:
+            priority = TaskPriority(request.priority)
+        except ValueError:
+            raise HTTPException(
+                status_code=400, detail=f"Invalid priority: {request.priority}"
+            )
+        task_creates.append(
+            TaskCreate(
+                title=request.title,
+                description=request.description,
+                priority=priority,
+                payload=request.payload,
+                max_retries=request.max_retries,
+            )
+        )
+
+    tasks = get_db().create_tasks_bulk(task_creates)
+    return [TaskResponse(**task.to_dict()) for task in tasks]
+
+
 @app.get("/tasks", response_model=List[TaskResponse], tags=["Tasks"])
 @capture
 def list_tasks(
@@ -27,10 +27,30 @@ try:
 except ImportError:
     PSYCOPG2_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from dotenv import load_dotenv
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+
+def _json_dumps(data: Any) -> str:
+    """Serialize a capture payload (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data)
+
+
+def _json_loads(raw: Any) -> Any:
+    """Deserialize a capture payload (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 # Load environment variables
 load_dotenv()
 
@@ -204,9 +224,21 @@ class CaptureStorage:
                     f"dbname={db_config['dbname']}"
                 )
         else:
-            # SQLite
-            self.db_path = Path(db_path or db_config.get("db_path", "chronicle_captures.db"))
-        
+            # SQLite. "file:" URIs are kept verbatim and opened with
+            # uri=True, so captures can go to an in-memory database such
+            # as "file:captures?mode=memory&cache=shared".
+            raw_path = db_path or db_config.get("db_path", "chronicle_captures.db")
+            self._sqlite_uri = isinstance(raw_path, str) and raw_path.startswith("file:")
+            self.db_path = raw_path if self._sqlite_uri else Path(raw_path)
+            # A shared-cache in-memory database only lives while at least
+            # one connection is open; hold one so the schema survives the
+            # per-call connect/close cycle below.
+            self._keepalive_conn = (
+                sqlite3.connect(raw_path, uri=True)
+                if self._sqlite_uri and "mode=memory" in raw_path
+                else None
+            )
+
         self._init_db()
 
     def _init_db(self) -> None:
@@ -279,7 +311,7 @@ class CaptureStorage:
             finally:
                 conn.close()
         else:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = sqlite3.connect(str(self.db_path), uri=self._sqlite_uri)
             try:
                 yield conn
             finally:
@@ -291,32 +323,46 @@ class CaptureStorage:
 
     def store(self, call: CapturedCall) -> None:
         """Store a captured call."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._insert_sql(), self._insert_row(call))
+            conn.commit()
+
+    def store_many(self, calls: List[CapturedCall]) -> None:
+        """Store multiple captured calls in a single transaction."""
+        if not calls:
+            return
+        rows = [self._insert_row(call) for call in calls]
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(self._insert_sql(), rows)
+            conn.commit()
+
+    def _insert_sql(self) -> str:
+        """Build the INSERT statement for captured calls."""
         param_placeholder = self._get_param_placeholder()
+        return f"""
+            INSERT INTO captured_calls
+            (id, function_name, module, data, start_time, duration_ms, has_error, created_at)
+            VALUES ({', '.join([param_placeholder] * 8)})
+        """
+
+    def _insert_row(self, call: CapturedCall) -> tuple:
+        """Build the parameter tuple for inserting a captured call."""
         start_time = call.start_time
         start_time_str = start_time.isoformat() if self.db_type == "sqlite" else start_time
         created_at = datetime.now(timezone.utc)
         created_at_str = created_at.isoformat() if self.db_type == "sqlite" else created_at
-        
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                f"""
-                INSERT INTO captured_calls
-                (id, function_name, module, data, start_time, duration_ms, has_error, created_at)
-                VALUES ({', '.join([param_placeholder] * 8)})
-                """,
-                (
-                    call.id,
-                    call.function_name,
-                    call.module,
-                    json.dumps(call.to_dict()),
-                    start_time_str,
-                    call.duration_ms,
-                    1 if call.exception else 0,
-                    created_at_str,
-                ),
-            )
-            conn.commit()
+        return (
+            call.id,
+            call.function_name,
+            call.module,
+            _json_dumps(call.to_dict()),
+            start_time_str,
+            call.duration_ms,
+            1 if call.exception else 0,
+            created_at_str,
+        )
 
     def get_calls(
         self,
@@ -345,7 +391,7 @@ class CaptureStorage:
             cursor = conn.cursor()
             cursor.execute(query, params)
             rows = cursor.fetchall()
-            return [CapturedCall.from_dict(json.loads(row[0])) for row in rows]
+            return [CapturedCall.from_dict(_json_loads(row[0])) for row in rows]
 
     def get_stats(self) -> dict:
         """Get capture statistics."""
@@ -426,6 +472,19 @@ def configure_storage(db_path: Optional[str] = None, db_config: Optional[dict] =
     return _storage
 
 
+# Global kill switch: when off, @capture-wrapped functions run bare with
+# no CapturedCall construction or storage I/O at all. Also settable up
+# front via the DEMO_CAPTURE_DISABLED env var for runs (CI, benchmarks)
+# that don't exercise capture.
+_capture_enabled = os.environ.get("DEMO_CAPTURE_DISABLED", "") != "1"
+
+
+def set_capture_enabled(enabled: bool) -> None:
+    """Turn capture on or off globally."""
+    global _capture_enabled
+    _capture_enabled = enabled
+
+
 def capture(func: F) -> F:
     """
     Decorator to capture function inputs and outputs.
@@ -438,6 +497,9 @@ def capture(func: F) -> F:
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not _capture_enabled:
+            return func(*args, **kwargs)
+
         # Get OpenTelemetry context if available
         trace_id = None
         span_id = None
@@ -484,9 +546,12 @@ def capture(func: F) -> F:
             # Check function limiter first (per-function limits)
             should_store = True
             try:
-                from integrations.ui import get_function_limiter
-                function_limiter = get_function_limiter()
-                if function_limiter and function_limiter._enabled:
+                from integrations.ui import get_function_limiter, is_function_limiting_active
+                # Module-level flag read is cheaper than fetching the
+                # limiter and checking its enabled attribute; skips the
+                # whole block when limiting was never turned on
+                if is_function_limiting_active():
+                    function_limiter = get_function_limiter()
                     if not function_limiter.should_capture(call.function_name):
                         should_store = False
             except (ImportError, AttributeError):
@@ -552,6 +617,10 @@ def capture_context(name: str):
         with capture_context("process_order"):
             # ... code to capture ...
     """
+    if not _capture_enabled:
+        yield None
+        return
+
     call = CapturedCall(function_name=name, module="__context__")
     ctx = CaptureContext(call)
     parent = CaptureContext.get_current()
@@ -3,6 +3,7 @@
 import json
 import os
 import sqlite3
+import uuid
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +16,12 @@ try:
 except ImportError:
     PSYCOPG2_AVAILABLE = False
 
+try:
+    from pydantic_core import from_json, to_json
+    PYDANTIC_CORE_AVAILABLE = True
+except ImportError:
+    PYDANTIC_CORE_AVAILABLE = False
+
 from dotenv import load_dotenv
 
 from .models import Task, TaskCreate, TaskPriority, TaskStatus, TaskUpdate
@@ -23,6 +30,20 @@ from .models import Task, TaskCreate, TaskPriority, TaskStatus, TaskUpdate
 load_dotenv()
 
 
+def _json_dumps(data: Any) -> str:
+    """Serialize a payload/result column (pydantic-core's Rust JSON when available)."""
+    if PYDANTIC_CORE_AVAILABLE:
+        return to_json(data).decode("utf-8")
+    return json.dumps(data)
+
+
+def _json_loads(raw: Any) -> Any:
+    """Deserialize a payload/result column (pydantic-core's Rust JSON when available)."""
+    if PYDANTIC_CORE_AVAILABLE:
+        return from_json(raw)
+    return json.loads(raw)
+
+
 def get_db_config() -> dict:
     """Get database configuration from environment variables."""
     db_type = os.getenv("DB_TYPE", "sqlite").lower()
@@ -50,23 +71,50 @@ def get_db_config() -> dict:
         }
 
 
+class _TransactionConnection:
+    """Connection proxy that defers commit/close to the end of a transaction() block."""
+
+    def __init__(self, conn: Any):
+        self._conn = conn
+
+    def commit(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+
 class TaskDatabase:
     """Task storage supporting both SQLite and PostgreSQL."""
 
-    def __init__(self, db_path: Optional[str] = None, db_config: Optional[dict] = None):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        db_config: Optional[dict] = None,
+        pragmas: Optional[List[str]] = None,
+    ):
         """
         Initialize the database.
-        
+
         Args:
             db_path: For SQLite, the path to the database file (deprecated, use db_config)
             db_config: Database configuration dict (if None, reads from environment)
+            pragmas: For SQLite, PRAGMA statements run on every connection.
+                Useful for ephemeral databases where durability is wasted
+                work, e.g. ["journal_mode=MEMORY", "synchronous=OFF",
+                "temp_store=MEMORY"]. Production defaults are unchanged
+                when omitted.
         """
         if db_config is None:
             db_config = get_db_config()
         
         self.db_config = db_config
         self.db_type = db_config["type"]
-        
+        self._txn_conn: Optional[_TransactionConnection] = None
+
         if self.db_type == "postgres":
             if not PSYCOPG2_AVAILABLE:
                 raise ImportError(
@@ -85,9 +133,22 @@ class TaskDatabase:
                     f"dbname={db_config['dbname']}"
                 )
         else:
-            # SQLite
-            self.db_path = Path(db_path or db_config.get("db_path", "demo_tasks.db"))
-        
+            # SQLite. "file:" URIs are kept verbatim and opened with
+            # uri=True, which enables in-memory databases such as
+            # "file:name?mode=memory&cache=shared" - no disk I/O at all.
+            raw_path = db_path or db_config.get("db_path", "demo_tasks.db")
+            self._sqlite_pragmas = tuple(pragmas or ())
+            self._sqlite_uri = isinstance(raw_path, str) and raw_path.startswith("file:")
+            self.db_path = raw_path if self._sqlite_uri else Path(raw_path)
+            # A shared-cache in-memory database only lives while at least
+            # one connection is open; hold one so the schema survives the
+            # per-call connect/close cycle below.
+            self._keepalive_conn = (
+                sqlite3.connect(raw_path, uri=True)
+                if self._sqlite_uri and "mode=memory" in raw_path
+                else None
+            )
+
         self._init_db()
 
     def _init_db(self) -> None:
@@ -125,6 +186,14 @@ class TaskDatabase:
                 cursor.execute("""
                     CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks(created_at)
                 """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_tasks_filter
+                    ON tasks(status, priority, created_at DESC)
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_tasks_pending_priority
+                    ON tasks(priority) WHERE status = 'pending'
+                """)
             else:
                 # SQLite schema
                 cursor.execute("""
@@ -155,12 +224,53 @@ class TaskDatabase:
                 cursor.execute("""
                     CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks(created_at)
                 """)
-            
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_tasks_filter
+                    ON tasks(status, priority, created_at DESC)
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_tasks_pending_priority
+                    ON tasks(priority) WHERE status = 'pending'
+                """)
+
             conn.commit()
 
+    @contextmanager
+    def transaction(self) -> Generator[Any, None, None]:
+        """
+        Group several database calls into a single transaction.
+
+        Inside the block, every method reuses one connection and the
+        per-call commits become no-ops; the work is committed once on
+        exit (or rolled back on error). This amortizes the fsync cost
+        when driving many small state transitions, e.g.::
+
+            with db.transaction():
+                db.claim_task(task_id, worker_id)
+                db.start_processing(task_id)
+                db.fail_task(task_id, "boom")
+        """
+        if self._txn_conn is not None:
+            # Already inside a transaction; nest transparently.
+            yield self._txn_conn
+            return
+        with self._get_connection() as conn:
+            self._txn_conn = _TransactionConnection(conn)
+            try:
+                yield self._txn_conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._txn_conn = None
+
     @contextmanager
     def _get_connection(self) -> Generator[Any, None, None]:
         """Get a database connection."""
+        if self._txn_conn is not None:
+            yield self._txn_conn
+            return
         if self.db_type == "postgres":
             conn = psycopg2.connect(self.connection_string)
             try:
@@ -168,8 +278,14 @@ class TaskDatabase:
             finally:
                 conn.close()
         else:
-            conn = sqlite3.connect(str(self.db_path))
+            # A generous statement cache keeps repeated SQL (bulk inserts,
+            # transaction() blocks) from re-running sqlite3_prepare.
+            conn = sqlite3.connect(
+                str(self.db_path), uri=self._sqlite_uri, cached_statements=128
+            )
             conn.row_factory = sqlite3.Row
+            for pragma in self._sqlite_pragmas:
+                conn.execute(f"PRAGMA {pragma}")
             try:
                 yield conn
             finally:
@@ -212,8 +328,8 @@ class TaskDatabase:
             description=row_dict.get("description") or "",
             status=TaskStatus(row_dict["status"]),
             priority=TaskPriority(row_dict["priority"]),
-            payload=json.loads(row_dict.get("payload") or "{}"),
-            result=json.loads(row_dict["result"]) if row_dict.get("result") else None,
+            payload=_json_loads(row_dict.get("payload") or "{}"),
+            result=_json_loads(row_dict["result"]) if row_dict.get("result") else None,
             error_message=row_dict.get("error_message"),
             created_at=parse_datetime(row_dict["created_at"]),
             updated_at=parse_datetime(row_dict["updated_at"]),
@@ -226,8 +342,6 @@ class TaskDatabase:
 
     def create_task(self, task_create: TaskCreate) -> Task:
         """Create a new task."""
-        import uuid
-
         now = datetime.utcnow()
         task = Task(
             id=str(uuid.uuid4()),
@@ -260,7 +374,7 @@ class TaskDatabase:
                     task.description,
                     task.status.value,
                     task.priority.value,
-                    json.dumps(task.payload),
+                    _json_dumps(task.payload),
                     None,
                     None,
                     created_at_str,
@@ -276,6 +390,96 @@ class TaskDatabase:
 
         return task
 
+    def create_tasks_bulk(self, task_creates: List[TaskCreate]) -> List[Task]:
+        """Create many tasks in one transaction (one commit, executemany)."""
+        now = datetime.utcnow()
+        created_at = now.isoformat() if self.db_type == "sqlite" else now
+
+        tasks = []
+        rows = []
+        for task_create in task_creates:
+            task = Task(
+                id=str(uuid.uuid4()),
+                title=task_create.title,
+                description=task_create.description,
+                priority=task_create.priority,
+                payload=task_create.payload,
+                max_retries=task_create.max_retries,
+                created_at=now,
+                updated_at=now,
+            )
+            tasks.append(task)
+            rows.append((
+                task.id,
+                task.title,
+                task.description,
+                task.status.value,
+                task.priority.value,
+                _json_dumps(task.payload),
+                None,
+                None,
+                created_at,
+                created_at,
+                None,
+                None,
+                None,
+                task.retry_count,
+                task.max_retries,
+            ))
+
+        if not rows:
+            return tasks
+
+        param_placeholder = self._get_param_placeholder()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                f"""
+                INSERT INTO tasks (
+                    id, title, description, status, priority, payload,
+                    result, error_message, created_at, updated_at,
+                    claimed_at, completed_at, claimed_by, retry_count, max_retries
+                ) VALUES ({', '.join([param_placeholder] * 15)})
+                """,
+                rows,
+            )
+            conn.commit()
+
+        return tasks
+
+    def seed(self, title: str, priority: str = "medium", status: str = "pending") -> str:
+        """
+        Insert a bare task row and return its id.
+
+        Intended for seeding state (demos, tests) where the caller never
+        reads the response: one raw INSERT, no model construction or
+        validation.
+        """
+        task_id = str(uuid.uuid4())
+        now = datetime.utcnow()
+        now_value = now.isoformat() if self.db_type == "sqlite" else now
+
+        param_placeholder = self._get_param_placeholder()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                INSERT INTO tasks (
+                    id, title, description, status, priority, payload,
+                    result, error_message, created_at, updated_at,
+                    claimed_at, completed_at, claimed_by, retry_count, max_retries
+                ) VALUES ({', '.join([param_placeholder] * 15)})
+                """,
+                (
+                    task_id, title, "", status, priority, "{}",
+                    None, None, now_value, now_value,
+                    None, None, None, 0, 3,
+                ),
+            )
+            conn.commit()
+
+        return task_id
+
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID."""
         param_placeholder = self._get_param_placeholder()
@@ -320,6 +524,59 @@ class TaskDatabase:
             rows = cursor.fetchall()
             return [self._row_to_task(row) for row in rows]
 
+    def list_tasks_after(
+        self,
+        created_before: Optional[datetime] = None,
+        before_id: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        limit: int = 100,
+    ) -> List[Task]:
+        """
+        List tasks using keyset (seek) pagination.
+
+        Unlike OFFSET, which scans and discards the skipped rows, seeking
+        on the cursor is O(limit) via the created_at index. Pass the last
+        row's created_at and id from the previous page as created_before
+        and before_id to fetch the next page; the id tiebreaker matters
+        because created_at is not unique (bulk inserts stamp a whole
+        batch with one timestamp).
+        """
+        param_placeholder = self._get_param_placeholder()
+        query = "SELECT * FROM tasks WHERE 1=1"
+        params: List = []
+
+        if created_before is not None:
+            cursor_value = (
+                created_before.isoformat() if self.db_type == "sqlite" else created_before
+            )
+            if before_id is not None:
+                query += (
+                    f" AND (created_at < {param_placeholder}"
+                    f" OR (created_at = {param_placeholder} AND id < {param_placeholder}))"
+                )
+                params.extend([cursor_value, cursor_value, before_id])
+            else:
+                query += f" AND created_at < {param_placeholder}"
+                params.append(cursor_value)
+
+        if status:
+            query += f" AND status = {param_placeholder}"
+            params.append(status.value)
+
+        if priority:
+            query += f" AND priority = {param_placeholder}"
+            params.append(priority.value)
+
+        query += f" ORDER BY created_at DESC, id DESC LIMIT {param_placeholder}"
+        params.append(limit)
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            return [self._row_to_task(row) for row in rows]
+
     def update_task(self, task_id: str, update: TaskUpdate) -> Optional[Task]:
         """Update a task."""
         task = self.get_task(task_id)
@@ -344,7 +601,7 @@ class TaskDatabase:
 
         if update.payload is not None:
             updates.append(f"payload = {param_placeholder}")
-            params.append(json.dumps(update.payload))
+            params.append(_json_dumps(update.payload))
 
         if updates:
             updated_at = datetime.utcnow()
@@ -485,7 +742,7 @@ class TaskDatabase:
                 """,
                 (
                     TaskStatus.COMPLETED.value,
-                    json.dumps(result) if result else None,
+                    _json_dumps(result) if result else None,
                     now_str,
                     now_str,
                     task_id,
@@ -580,6 +837,9 @@ class TaskDatabase:
         """Clear all tasks. Returns number of deleted tasks."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            # The WHERE-less DELETE uses SQLite's truncate optimization,
+            # which still reports the change count - no separate
+            # COUNT(*) scan needed.
             cursor.execute("DELETE FROM tasks")
             conn.commit()
             return cursor.rowcount
@@ -32,11 +32,15 @@ With configuration:
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
+import sys
 import time
 import traceback
-import uuid
+from collections import Counter, deque
 from dataclasses import dataclass, field
+from itertools import count, islice
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional, Set, Union
 
@@ -45,7 +49,7 @@ from starlette.requests import Request
 from starlette.responses import Response, StreamingResponse
 from starlette.routing import Match
 
-from .sampling import Sampler, get_sampler
+from .sampling import Sampler, get_sampler, get_sampler_version
 
 # Import type limiter if available (lazy import to avoid circular deps)
 def _get_type_limiter():
@@ -116,7 +120,7 @@ class CapturedRequest:
     """A captured HTTP request with full details."""
 
     id: str
-    timestamp: datetime
+    timestamp: float  # seconds since epoch; formatted lazily in to_dict
     method: str
     path: str
     full_url: str
@@ -149,11 +153,16 @@ class CapturedRequest:
     sampled: bool = True
     sampling_reason: Optional[str] = None
 
+    # Monotonic store order, assigned when the request enters storage.
+    # Serves as the cursor for incremental fetches from the dashboard.
+    seq: int = 0
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
         return {
             "id": self.id,
-            "timestamp": self.timestamp.isoformat(),
+            "seq": self.seq,
+            "timestamp": datetime.fromtimestamp(self.timestamp, tz=timezone.utc).isoformat(),
             "method": self.method,
             "path": self.path,
             "full_url": self.full_url,
@@ -176,13 +185,33 @@ class CapturedRequest:
         }
 
 
-# Storage for captured requests (in-memory by default)
-_captured_requests: List[CapturedRequest] = []
-_max_stored_requests: int = 10000
+# Storage for captured requests (in-memory by default). A bounded deque
+# gives O(1) appends with automatic oldest-first eviction - no list
+# realloc/memmove as the store grows, and RSS is capped by construction.
+_max_stored_requests: int = int(os.environ.get("CHRONICLE_MAX_CAPTURES", "10000"))
+_captured_requests: deque = deque(maxlen=_max_stored_requests)
+_capture_seq = count(1)
+
+# Background queue so storage (and user callbacks) run off the request path.
+# The consumer is bound to one event loop; _capture_consumer_loop records
+# which, so a new loop (test clients, restarts) gets a fresh queue+consumer.
+_capture_queue: Optional[asyncio.Queue] = None
+_capture_consumer_task: Optional[asyncio.Task] = None
+_capture_consumer_loop: Optional[asyncio.AbstractEventLoop] = None
+_max_queued_requests: int = 10000
 
 # Callbacks for custom storage
 _capture_callbacks: List[Callable[[CapturedRequest], None]] = []
 
+# Running aggregates maintained at store time so get_capture_stats is O(1)
+_stats_by_method: Counter = Counter()
+_stats_by_status: Counter = Counter()
+_stats_error_count: int = 0
+_stats_total_duration: float = 0.0
+# Per-endpoint capture counts keyed by (method, path), also kept at store time
+# so endpoint summaries never have to rescan the whole store
+_endpoint_counts: Counter = Counter()
+
 
 def add_capture_callback(callback: Callable[[CapturedRequest], None]) -> None:
     """
@@ -211,47 +240,78 @@ def get_captured_requests(
 
     Returns most recent first.
     """
-    results = _captured_requests.copy()
+    preds: List[Callable[[CapturedRequest], bool]] = []
 
     if method:
-        results = [r for r in results if r.method == method.upper()]
+        method_upper = method.upper()
+        preds.append(lambda r: r.method == method_upper)
 
     if path_prefix:
-        results = [r for r in results if r.path.startswith(path_prefix)]
+        preds.append(lambda r: r.path.startswith(path_prefix))
 
     if status_code is not None:
-        results = [r for r in results if r.status_code == status_code]
+        preds.append(lambda r: r.status_code == status_code)
 
     if has_error is not None:
         if has_error:
-            results = [r for r in results if r.error is not None]
+            preds.append(lambda r: r.error is not None)
         else:
-            results = [r for r in results if r.error is None]
+            preds.append(lambda r: r.error is None)
 
-    # Most recent first
-    results.sort(key=lambda r: r.timestamp, reverse=True)
-
-    return results[:limit]
+    # Requests are stored in arrival order, so walking in reverse yields
+    # most recent first - one pass, no intermediate lists or sort
+    matches = (r for r in reversed(_captured_requests) if all(p(r) for p in preds))
+    return list(islice(matches, limit))
 
 
 def clear_captured_requests() -> int:
     """Clear all captured requests. Returns count cleared."""
-    global _captured_requests
+    global _stats_error_count, _stats_total_duration
     count = len(_captured_requests)
-    _captured_requests = []
+    _captured_requests.clear()
+    _stats_by_method.clear()
+    _stats_by_status.clear()
+    _endpoint_counts.clear()
+    _stats_error_count = 0
+    _stats_total_duration = 0.0
     return count
 
 
+def _add_to_stats(captured: CapturedRequest, sign: int = 1) -> None:
+    """Update the running stats counters for a stored (or evicted) request."""
+    global _stats_error_count, _stats_total_duration
+
+    _stats_by_method[captured.method] += sign
+    if captured.status_code:
+        _stats_by_status[captured.status_code] += sign
+    endpoint_key = (captured.method, captured.path)
+    _endpoint_counts[endpoint_key] += sign
+    if _endpoint_counts[endpoint_key] <= 0:
+        del _endpoint_counts[endpoint_key]
+    if captured.error:
+        _stats_error_count += sign
+    _stats_total_duration += sign * captured.duration_ms
+
+
 def _store_captured_request(captured: CapturedRequest) -> None:
     """Store a captured request."""
-    global _captured_requests
+    # Intern the heavily-repeated strings so the store shares one object
+    # per distinct value and dict lookups hit the pointer-equality fast path
+    captured.method = sys.intern(captured.method)
+    captured.path = sys.intern(captured.path)
+    if captured.route_name:
+        captured.route_name = sys.intern(captured.route_name)
+
+    captured.seq = next(_capture_seq)
+
+    # The deque evicts the oldest entry on append once full; unwind its
+    # contribution from the running counters first so they stay in sync
+    if len(_captured_requests) == _max_stored_requests:
+        _add_to_stats(_captured_requests[0], sign=-1)
 
     # Add to in-memory storage
     _captured_requests.append(captured)
-
-    # Trim if over limit
-    if len(_captured_requests) > _max_stored_requests:
-        _captured_requests = _captured_requests[-_max_stored_requests:]
+    _add_to_stats(captured)
 
     # Call custom callbacks
     for callback in _capture_callbacks:
@@ -261,6 +321,52 @@ def _store_captured_request(captured: CapturedRequest) -> None:
             pass  # Don't let callback errors break the middleware
 
 
+async def _capture_consumer(queue: asyncio.Queue) -> None:
+    """Drain the capture queue, storing requests in the background."""
+    while True:
+        captured = await queue.get()
+        try:
+            _store_captured_request(captured)
+        except Exception:
+            pass  # Don't let storage errors kill the consumer
+
+
+def _enqueue_captured_request(captured: CapturedRequest) -> None:
+    """
+    Hand a captured request to the background consumer.
+
+    Storage (list append, bounds trim, callbacks - some of which may do
+    DB writes) happens off the request path so dispatch can return the
+    response immediately. If the queue is full the request is dropped,
+    mirroring the bounded-storage policy. Falls back to synchronous
+    storage when no event loop is running. If the consumer's loop is no
+    longer the running one (fresh TestClient, in-process restart) or the
+    consumer task died, both are recreated on the current loop so
+    captures never pile up in a queue nothing drains.
+    """
+    global _capture_queue, _capture_consumer_task, _capture_consumer_loop
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _store_captured_request(captured)
+        return
+
+    if (
+        _capture_queue is None
+        or loop is not _capture_consumer_loop
+        or _capture_consumer_task.done()
+    ):
+        _capture_queue = asyncio.Queue(maxsize=_max_queued_requests)
+        _capture_consumer_task = loop.create_task(_capture_consumer(_capture_queue))
+        _capture_consumer_loop = loop
+
+    try:
+        _capture_queue.put_nowait(captured)
+    except asyncio.QueueFull:
+        pass  # Tail-drop under sustained overload
+
+
 class ChronicleMiddleware(BaseHTTPMiddleware):
     """
     FastAPI/Starlette middleware for automatic request/response capture.
@@ -287,6 +393,10 @@ class ChronicleMiddleware(BaseHTTPMiddleware):
         self.config = config or CaptureConfig()
         self.sampler = sampler
 
+        # Cached global sampler, refreshed when configure_sampling replaces it
+        self._cached_sampler: Optional[Sampler] = None
+        self._cached_sampler_version: int = -1
+
         # Apply convenience overrides
         self.config.capture_request_body = capture_request_body
         self.config.capture_response_body = capture_response_body
@@ -298,20 +408,37 @@ class ChronicleMiddleware(BaseHTTPMiddleware):
         if redact_headers:
             self.config.redact_headers = redact_headers
 
+        # Precompute the lowercased redaction set once
+        self._redact_headers_lower = {h.lower() for h in self.config.redact_headers}
+
     def _get_sampler(self) -> Sampler:
         """Get the sampler to use."""
-        return self.sampler or get_sampler()
-
-    def _redact_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
-        """Redact sensitive headers."""
+        if self.sampler is not None:
+            return self.sampler
+        # Memoize the global sampler; the version counter invalidates the
+        # cache if configure_sampling is called at runtime
+        if self._cached_sampler is None or self._cached_sampler_version != get_sampler_version():
+            self._cached_sampler = get_sampler()
+            self._cached_sampler_version = get_sampler_version()
+        return self._cached_sampler
+
+    def _redact_headers(self, headers: Any) -> Dict[str, str]:
+        """
+        Redact sensitive headers.
+
+        Accepts the Starlette Headers object (or any mapping) directly and
+        builds the redacted dict in a single pass, avoiding an intermediate
+        dict(...) materialization at the call sites.
+        """
         redacted = {}
-        redact_set = {h.lower() for h in self.config.redact_headers}
+        redact_set = self._redact_headers_lower
+        max_size = self.config.max_header_value_size
 
         for key, value in headers.items():
             if key.lower() in redact_set:
                 redacted[key] = "[REDACTED]"
-            elif len(str(value)) > self.config.max_header_value_size:
-                redacted[key] = str(value)[:self.config.max_header_value_size] + "...[truncated]"
+            elif len(str(value)) > max_size:
+                redacted[key] = str(value)[:max_size] + "...[truncated]"
             else:
                 redacted[key] = value
 
@@ -431,15 +558,17 @@ class ChronicleMiddleware(BaseHTTPMiddleware):
         """Extract path parameters."""
         if not self.config.capture_path_params:
             return None
-        path_params = dict(request.path_params)
-        return path_params if path_params else None
+        # Only copy when non-empty - the common no-params case allocates nothing
+        path_params = request.path_params
+        return dict(path_params) if path_params else None
 
     def _get_query_params(self, request: Request) -> Optional[Dict[str, Any]]:
         """Extract query parameters."""
         if not self.config.capture_query_params:
             return None
-        query_params = dict(request.query_params)
-        return query_params if query_params else None
+        # Only copy when non-empty - the common no-params case allocates nothing
+        query_params = request.query_params
+        return dict(query_params) if query_params else None
 
     async def dispatch(
         self,
@@ -455,20 +584,20 @@ class ChronicleMiddleware(BaseHTTPMiddleware):
         if path_lower.startswith("/_chronicle"):
             return await call_next(request)
         
-        # Check exclusion list from config
+        # Check exclusion list from config: exact match against the
+        # precompiled frozenset, sub-paths via one C-level startswith over
+        # the "prefix/" tuple (both rebuilt by rebuild_endpoint_matchers)
         sampler = self._get_sampler()
-        for excluded in sampler.config.never_capture_endpoints:
-            excluded_lower = excluded.lower().rstrip("/")
-            path_normalized = path_lower.rstrip("/")
-            # Match exact path or any sub-path (must start with excluded path + "/")
-            if (path_normalized == excluded_lower or 
-                path_lower.startswith(excluded_lower + "/")):
-                # Skip all capture processing for excluded endpoints
-                return await call_next(request)
+        config = sampler.config
+        if (path_lower.rstrip("/") in config._never_exact or
+                path_lower.startswith(config._never_prefixes)):
+            # Skip all capture processing for excluded endpoints
+            return await call_next(request)
         
         start_time = time.perf_counter()
-        request_id = str(uuid.uuid4())
-        timestamp = datetime.now(timezone.utc)
+        # Cheaper than str(uuid.uuid4()) - the id is opaque to consumers
+        request_id = os.urandom(16).hex()
+        timestamp = time.time()
 
         # Extract request details early
         method = request.method
@@ -479,13 +608,21 @@ class ChronicleMiddleware(BaseHTTPMiddleware):
         client_ip = request.client.host if request.client else None
         user_agent = request.headers.get("user-agent")
 
-        # Get request body (need to do this before call_next consumes it)
-        request_body, request_body_size = await self._get_request_body(request)
+        # Cheap pre-request decision: if the sampler already knows it will
+        # drop this request, skip the input-side capture work entirely
+        pre_decision = sampler.pre_decide(path, method)
 
-        # Get request headers
+        request_body = None
+        request_body_size = 0
         request_headers = None
-        if self.config.capture_request_headers:
-            request_headers = self._redact_headers(dict(request.headers))
+
+        if pre_decision is not False:
+            # Get request body (need to do this before call_next consumes it)
+            request_body, request_body_size = await self._get_request_body(request)
+
+            # Get request headers
+            if self.config.capture_request_headers:
+                request_headers = self._redact_headers(request.headers)
 
         # Process the actual request
         response = None
@@ -507,7 +644,7 @@ class ChronicleMiddleware(BaseHTTPMiddleware):
             duration_ms = (time.perf_counter() - start_time) * 1000
 
             # Check sampling AFTER we have status code and duration
-            sampler = self._get_sampler()
+            # (reuses the sampler fetched for the exclusion check above)
             should_capture = sampler.should_capture(
                 endpoint=path,
                 method=method,
@@ -536,18 +673,27 @@ class ChronicleMiddleware(BaseHTTPMiddleware):
                 if response is not None:
                     # Response headers
                     if self.config.capture_response_headers:
-                        response_headers = self._redact_headers(dict(response.headers))
+                        response_headers = self._redact_headers(response.headers)
 
                     # Response body - need to intercept it
                     if self.config.capture_response_body:
+                        content_type = response.headers.get("content-type")
+
+                        # Short-circuit on content type before touching the
+                        # body - keeps true streaming responses (SSE, video)
+                        # streaming instead of buffering them
+                        if not self._should_capture_content_type(content_type):
+                            response_body = f"[Body not captured - content-type: {content_type}]"
+                            response_body_size = int(
+                                response.headers.get("content-length", "0") or 0
+                            )
                         # For StreamingResponse, we need to collect the body
-                        if isinstance(response, StreamingResponse):
+                        elif isinstance(response, StreamingResponse):
                             body_parts = []
                             async for chunk in response.body_iterator:
                                 body_parts.append(chunk)
                             body_bytes = b"".join(body_parts)
 
-                            content_type = response.headers.get("content-type")
                             response_body, response_body_size = self._get_response_body(
                                 body_bytes, content_type
                             )
@@ -584,8 +730,8 @@ class ChronicleMiddleware(BaseHTTPMiddleware):
                     sampled=True,
                 )
 
-                # Store the captured request
-                _store_captured_request(captured)
+                # Queue the captured request for background storage
+                _enqueue_captured_request(captured)
 
         return response
 
@@ -593,9 +739,9 @@ class ChronicleMiddleware(BaseHTTPMiddleware):
 # Convenience function to get capture stats
 def get_capture_stats() -> Dict[str, Any]:
     """Get statistics about captured requests."""
-    requests = _captured_requests
+    total = len(_captured_requests)
 
-    if not requests:
+    if not total:
         return {
             "total_captured": 0,
             "by_method": {},
@@ -604,28 +750,13 @@ def get_capture_stats() -> Dict[str, Any]:
             "avg_duration_ms": 0,
         }
 
-    by_method: Dict[str, int] = {}
-    by_status: Dict[int, int] = {}
-    error_count = 0
-    total_duration = 0.0
-
-    for req in requests:
-        by_method[req.method] = by_method.get(req.method, 0) + 1
-
-        if req.status_code:
-            by_status[req.status_code] = by_status.get(req.status_code, 0) + 1
-
-        if req.error:
-            error_count += 1
-
-        total_duration += req.duration_ms
-
+    # Counters are maintained incrementally at store time, so this is O(1)
     return {
-        "total_captured": len(requests),
-        "by_method": by_method,
-        "by_status": by_status,
-        "error_count": error_count,
-        "error_rate": round(error_count / len(requests) * 100, 2) if requests else 0,
-        "avg_duration_ms": round(total_duration / len(requests), 2) if requests else 0,
+        "total_captured": total,
+        "by_method": dict(_stats_by_method),
+        "by_status": dict(_stats_by_status),
+        "error_count": _stats_error_count,
+        "error_rate": round(_stats_error_count / total * 100, 2),
+        "avg_duration_ms": round(_stats_total_duration / total, 2),
         "sampling_stats": get_sampler().get_stats(),
     }
@@ -10,14 +10,53 @@ Provides configurable sampling to control capture volume in high-traffic scenari
 
 from __future__ import annotations
 
-import hashlib
+import itertools
+import os
 import random
+import re
+import sys
 import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from threading import Lock
-from typing import Any, Dict, Optional, Set
+from functools import lru_cache
+from threading import Lock, local
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+# Interned HTTP method names: sampling state is keyed on
+# (method, endpoint) tuples, and interning makes the method compare by
+# pointer during dict lookups
+_METHODS = {m: sys.intern(m) for m in (
+    "GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS",
+)}
+
+
+# Pre-resolved structure tags for common request-body types: an exact
+# type() lookup here skips the isinstance MRO walk and the
+# type(x).__name__ attribute fetch on the clustering hot path
+_BODY_TAGS = {
+    list: "list",
+    tuple: "tuple",
+    str: "str",
+    bytes: "bytes",
+    int: "int",
+    float: "float",
+    bool: "bool",
+}
+
+
+@lru_cache(maxsize=4096)
+def _prefix_match(pattern: "re.Pattern", endpoint_lower: str) -> bool:
+    """
+    Memoized prefix-pattern match for endpoint allow/deny checks.
+
+    Real APIs see a small set of distinct paths, so after warm-up every
+    request resolves in lru_cache's C-level dict lookup instead of a
+    regex walk. Keying on the compiled pattern object means a rebuilt
+    matcher naturally misses the old entries.
+    """
+    return pattern.match(endpoint_lower) is not None
 
 
 class SamplingStrategy(str, Enum):
@@ -72,6 +111,11 @@ class SamplingConfig:
     # CLUSTERING specific: max unique patterns to track per endpoint
     max_patterns_per_endpoint: int = 100
 
+    # CLUSTERING specific: max endpoints to track pattern sets for;
+    # least-recently-used endpoints are evicted past this (bounds memory
+    # on APIs with unbounded path parameters)
+    max_tracked_endpoints: int = 1024
+
     # HEAD specific: how many requests per endpoint to capture
     head_count: int = 100
 
@@ -99,6 +143,41 @@ class SamplingConfig:
         "/favicon.ico",
     })
 
+    def __post_init__(self) -> None:
+        self.rebuild_endpoint_matchers()
+
+    def rebuild_endpoint_matchers(self) -> None:
+        """
+        (Re)compile the prefix matchers for the endpoint allow/deny sets.
+
+        Must be called again after mutating never_capture_endpoints or
+        always_capture_endpoints in place.
+        """
+        self._never_re = self._compile_prefix_pattern(self.never_capture_endpoints)
+        self._always_re = self._compile_prefix_pattern(self.always_capture_endpoints)
+        # Middleware fast path: exact matches hit a frozenset, sub-paths go
+        # through one C-level startswith over a tuple of "prefix/" strings -
+        # no per-request Python loop or normalization allocations
+        never_norm = {e.lower().rstrip("/") for e in self.never_capture_endpoints}
+        self._never_exact = frozenset(never_norm)
+        self._never_prefixes = tuple(sorted(p + "/" for p in never_norm))
+
+    @staticmethod
+    def _compile_prefix_pattern(endpoints: Set[str]) -> Optional[re.Pattern]:
+        """
+        Compile a set of endpoint prefixes into one anchored alternation.
+
+        Alternatives are ordered shortest-first so the engine exits on
+        the cheapest matching prefix, and the pattern is deterministic
+        regardless of set iteration order.
+        """
+        if not endpoints:
+            return None
+        alternatives = sorted(
+            (re.escape(e.lower()) for e in endpoints), key=len
+        )
+        return re.compile("^(?:" + "|".join(alternatives) + ")")
+
 
 class Sampler:
     """
@@ -107,21 +186,102 @@ class Sampler:
     Thread-safe implementation supporting multiple strategies.
     """
 
+    # Slots keep the (long-lived, hot) sampler instance off a __dict__:
+    # attribute reads in the capture path become fixed-offset slot loads.
+    # should_capture is a slot because __init__ installs the decision
+    # function (specialized closure or the generic bound method) there.
+    __slots__ = (
+        "config",
+        "_lock",
+        "_rng_local",
+        "_strategy",
+        "_base_rate",
+        "_capture_errors",
+        "_capture_slow",
+        "_latency_threshold",
+        "_error_codes",
+        "_head_count",
+        "_max_patterns",
+        "_adaptive_window_ns",
+        "_adaptive_multiplier",
+        "_adaptive_max_rate",
+        "_dispatch",
+        "should_capture",
+        "_shards",
+        "_max_endpoints_per_shard",
+        "_recent_ts",
+        "_recent_err",
+        "_error_count",
+        "_adaptive_rate",
+    )
+
     def __init__(self, config: Optional[SamplingConfig] = None):
         self.config = config or SamplingConfig()
         self._lock = Lock()
 
-        # CLUSTERING state: track seen input patterns per endpoint
-        self._seen_patterns: Dict[str, Set[str]] = {}
+        # Per-thread RNGs so sampling draws don't contend on the
+        # module-level Mersenne Twister state
+        self._rng_local = local()
+
+        # Bind hot config values as direct attributes so should_capture
+        # avoids chasing self.config.X through the dataclass on every
+        # call (configure_sampling replaces the whole Sampler, so these
+        # cannot go stale; the endpoint regexes stay on the config since
+        # they can be rebuilt in place)
+        self._strategy = self.config.strategy
+        self._base_rate = self.config.base_rate
+        self._capture_errors = self.config.always_capture_errors
+        self._capture_slow = self.config.always_capture_slow
+        self._latency_threshold = self.config.latency_threshold_ms
+        self._error_codes = self.config.error_status_codes
+        self._head_count = self.config.head_count
+        self._max_patterns = self.config.max_patterns_per_endpoint
+        self._adaptive_window_ns = self.config.adaptive_window_seconds * 1_000_000_000
+        self._adaptive_multiplier = self.config.adaptive_error_multiplier
+        self._adaptive_max_rate = self.config.adaptive_max_rate
+
+        # Strategy dispatch table; replaces the if/elif chain in
+        # should_capture (each handler takes the same arguments)
+        self._dispatch = {
+            SamplingStrategy.ALL: self._sample_all,
+            SamplingStrategy.RANDOM: self._sample_random,
+            SamplingStrategy.CLUSTERING: self._sample_clustering,
+            SamplingStrategy.ADAPTIVE: self._sample_adaptive,
+            SamplingStrategy.HEAD: self._sample_head,
+            SamplingStrategy.CONDITIONAL: self._sample_conditional,
+        }
+
+        # Specialize should_capture for the configured strategy: the
+        # instance attribute holds a closure containing only the
+        # branches this strategy can ever take, or the generic bound
+        # method when no specialization applies
+        specialized = self._build_should_capture()
+        self.should_capture = (
+            specialized if specialized is not None else self._should_capture_generic
+        )
 
-        # HEAD state: count per endpoint
-        self._head_counts: Dict[str, int] = {}
+        # CLUSTERING/HEAD state, sharded by endpoint key so concurrent
+        # requests to different endpoints don't serialize on one lock.
+        # Each shard is (lock, seen_patterns, head_counts) where
+        # seen_patterns is an LRU-ordered map endpoint_key -> Set[int]
+        # and head_counts maps endpoint_key -> itertools.count (next()
+        # is GIL-atomic, so the shard lock is only needed to insert a
+        # new counter)
+        self._shards = [(Lock(), OrderedDict(), {}) for _ in range(16)]
+        self._max_endpoints_per_shard = max(
+            1, self.config.max_tracked_endpoints // 16
+        )
 
-        # ADAPTIVE state: recent error tracking
-        self._recent_requests: list = []  # [(timestamp, is_error), ...]
-        self._adaptive_rate: float = self.config.base_rate
+        # ADAPTIVE state: recent error tracking as two parallel deques
+        # (monotonic-ns timestamps and error flags) instead of one deque
+        # of tuples - avoids a tuple allocation per recorded request,
+        # and integer timestamps are immune to wall-clock jumps
+        self._recent_ts: deque = deque()
+        self._recent_err: deque = deque()
+        self._error_count: int = 0
+        self._adaptive_rate: float = self._base_rate
 
-    def should_capture(
+    def _should_capture_generic(
         self,
         endpoint: str,
         method: str,
@@ -147,71 +307,268 @@ class Sampler:
         Returns:
             True if the request should be captured
         """
+        # Lowercase once and reuse for both endpoint-list checks
+        endpoint_lower = endpoint.lower()
+
         # Check never capture list
-        if self._should_skip_endpoint(endpoint):
+        if self._should_skip_endpoint(endpoint_lower):
             return False
 
         # Check always capture list
-        if self._should_always_capture_endpoint(endpoint):
+        if self._should_always_capture_endpoint(endpoint_lower):
             return True
 
-        # Always capture errors if configured
-        if self.config.always_capture_errors and status_code is not None:
-            if status_code in self.config.error_status_codes:
-                self._record_for_adaptive(is_error=True)
-                return True
+        # Pre-request calls carry no response info, so the error/slow
+        # escapes can't apply - skip their checks entirely
+        if status_code is not None or duration_ms is not None:
+            # Always capture errors if configured
+            if self._capture_errors and status_code is not None:
+                if status_code in self._error_codes:
+                    self._record_for_adaptive(is_error=True)
+                    return True
 
-        # Always capture slow requests if configured
-        if self.config.always_capture_slow and duration_ms is not None:
-            if duration_ms >= self.config.latency_threshold_ms:
-                return True
+            # Always capture slow requests if configured
+            if self._capture_slow and duration_ms is not None:
+                if duration_ms >= self._latency_threshold:
+                    return True
 
         # Apply strategy-specific logic
-        strategy = self.config.strategy
+        handler = self._dispatch.get(self._strategy)
+        if handler is None:
+            return False
+        return handler(endpoint, method, request_body, query_params)
+
+    def should_capture_batch(
+        self,
+        endpoints: Sequence[str],
+        methods: Sequence[str],
+        status_codes: Optional[Sequence[Optional[int]]] = None,
+        durations_ms: Optional[Sequence[Optional[float]]] = None,
+    ) -> List[bool]:
+        """
+        Batch variant of should_capture for callers that buffer requests
+        before deciding what to keep.
+
+        Binds the (per-strategy specialized) decision function once and
+        runs it across the batch, amortizing the attribute lookups that
+        dominate tiny per-call costs. Stateful strategies (CLUSTERING,
+        ADAPTIVE, HEAD) are applied in batch order.
+
+        Returns:
+            A list of booleans aligned with the input sequences.
+        """
+        decide = self.should_capture
+
+        if status_codes is None and durations_ms is None:
+            return [decide(e, m) for e, m in zip(endpoints, methods)]
+
+        if status_codes is None:
+            status_codes = [None] * len(endpoints)
+        if durations_ms is None:
+            durations_ms = [None] * len(endpoints)
+
+        return [
+            decide(e, m, status_code=s, duration_ms=d)
+            for e, m, s, d in zip(endpoints, methods, status_codes, durations_ms)
+        ]
+
+    def _build_should_capture(self) -> Any:
+        """
+        Build a should_capture closure specialized for the configured
+        strategy.
+
+        The generic method re-checks flags and dispatches on every call
+        even though the strategy is fixed for the sampler's lifetime.
+        Each closure below contains only the checks its strategy needs,
+        with config values bound as locals. The endpoint regexes are
+        read from the config on each call since they can be rebuilt in
+        place.
+        """
+        config = self.config
+        capture_errors = self._capture_errors
+        capture_slow = self._capture_slow
+        error_codes = self._error_codes
+        latency_threshold = self._latency_threshold
+        base_rate = self._base_rate
+        strategy = self._strategy
+        get_rng = self._get_rng
+
+        if strategy is SamplingStrategy.ALL:
+            # Everything except the never-capture list is captured, so
+            # the error/slow/always checks can't change the outcome
+            def _capture_all(
+                endpoint: str,
+                method: str,
+                status_code: Optional[int] = None,
+                duration_ms: Optional[float] = None,
+                request_body: Optional[Any] = None,
+                query_params: Optional[Dict[str, Any]] = None,
+            ) -> bool:
+                never_re = config._never_re
+                return never_re is None or not _prefix_match(never_re, endpoint.lower())
+
+            return _capture_all
+
+        if strategy is SamplingStrategy.ADAPTIVE:
+            # ADAPTIVE needs error recording on the error escape, so it
+            # keeps the generic path
+            return None
+
+        handler = self._dispatch[strategy]
+
+        def _capture_specialized(
+            endpoint: str,
+            method: str,
+            status_code: Optional[int] = None,
+            duration_ms: Optional[float] = None,
+            request_body: Optional[Any] = None,
+            query_params: Optional[Dict[str, Any]] = None,
+        ) -> bool:
+            endpoint_lower = endpoint.lower()
+
+            never_re = config._never_re
+            if never_re is not None and _prefix_match(never_re, endpoint_lower):
+                return False
+
+            always_re = config._always_re
+            if always_re is not None and _prefix_match(always_re, endpoint_lower):
+                return True
+
+            if status_code is not None or duration_ms is not None:
+                if capture_errors and status_code is not None:
+                    if status_code in error_codes:
+                        return True
+
+                if capture_slow and duration_ms is not None:
+                    if duration_ms >= latency_threshold:
+                        return True
+
+            return handler(endpoint, method, request_body, query_params)
+
+        if strategy is SamplingStrategy.RANDOM:
+            # RANDOM doesn't need the endpoint/method args at all
+            def _capture_random(
+                endpoint: str,
+                method: str,
+                status_code: Optional[int] = None,
+                duration_ms: Optional[float] = None,
+                request_body: Optional[Any] = None,
+                query_params: Optional[Dict[str, Any]] = None,
+            ) -> bool:
+                endpoint_lower = endpoint.lower()
+
+                never_re = config._never_re
+                if never_re is not None and _prefix_match(never_re, endpoint_lower):
+                    return False
+
+                always_re = config._always_re
+                if always_re is not None and _prefix_match(always_re, endpoint_lower):
+                    return True
+
+                if status_code is not None or duration_ms is not None:
+                    if capture_errors and status_code is not None:
+                        if status_code in error_codes:
+                            return True
+
+                    if capture_slow and duration_ms is not None:
+                        if duration_ms >= latency_threshold:
+                            return True
+
+                return get_rng().random() < base_rate
+
+            return _capture_random
+
+        return _capture_specialized
+
+    def pre_decide(self, endpoint: str, method: str) -> Optional[bool]:
+        """
+        Cheap pre-request sampling decision from endpoint and method alone.
+
+        Returns True for definite-capture, False for definite-drop, and
+        None when the decision needs post-response info (status code,
+        duration, body). Callers can skip expensive input capture work
+        for requests that will certainly be dropped.
+        """
+        endpoint_lower = endpoint.lower()
+
+        if self._should_skip_endpoint(endpoint_lower):
+            return False
+
+        if self._should_always_capture_endpoint(endpoint_lower):
+            return True
+
+        strategy = self._strategy
 
         if strategy == SamplingStrategy.ALL:
             return True
 
-        elif strategy == SamplingStrategy.RANDOM:
-            return self._sample_random()
+        # Error/slow escapes can still force capture after the response,
+        # so no definite-drop is possible while they are enabled
+        if self._capture_errors or self._capture_slow:
+            return None
 
-        elif strategy == SamplingStrategy.CLUSTERING:
-            return self._sample_clustering(
-                endpoint, method, request_body, query_params
-            )
+        if strategy == SamplingStrategy.CONDITIONAL:
+            # Only captures errors and slow requests, and those escapes
+            # are disabled - nothing can trigger capture
+            return False
 
-        elif strategy == SamplingStrategy.ADAPTIVE:
-            self._record_for_adaptive(is_error=False)
-            return self._sample_adaptive()
+        if strategy == SamplingStrategy.HEAD:
+            # Definite-drop once the per-endpoint head budget is exhausted
+            # (read-only check; should_capture still does the increment)
+            endpoint_key = (_METHODS.get(method, method), endpoint)
+            _, _, counts = self._shards[hash(endpoint_key) & 15]
+            counter = counts.get(endpoint_key)
+            if counter is not None and self._counter_value(counter) >= self._head_count:
+                return False
 
-        elif strategy == SamplingStrategy.HEAD:
-            return self._sample_head(endpoint, method)
+        return None
 
-        elif strategy == SamplingStrategy.CONDITIONAL:
-            # Only capture errors and slow requests (already handled above)
-            return False
+    def _should_skip_endpoint(self, endpoint_lower: str) -> bool:
+        """Check if endpoint (already lowercased) is in the never-capture list."""
+        pattern = self.config._never_re
+        return pattern is not None and _prefix_match(pattern, endpoint_lower)
 
-        return False
+    def _should_always_capture_endpoint(self, endpoint_lower: str) -> bool:
+        """Check if endpoint (already lowercased) is in the always-capture list."""
+        pattern = self.config._always_re
+        return pattern is not None and _prefix_match(pattern, endpoint_lower)
 
-    def _should_skip_endpoint(self, endpoint: str) -> bool:
-        """Check if endpoint is in never-capture list."""
-        endpoint_lower = endpoint.lower()
-        for skip in self.config.never_capture_endpoints:
-            if endpoint_lower == skip.lower() or endpoint_lower.startswith(skip.lower()):
-                return True
-        return False
+    def _sample_all(
+        self,
+        endpoint: str,
+        method: str,
+        request_body: Optional[Any],
+        query_params: Optional[Dict[str, Any]],
+    ) -> bool:
+        """Capture everything."""
+        return True
 
-    def _should_always_capture_endpoint(self, endpoint: str) -> bool:
-        """Check if endpoint is in always-capture list."""
-        endpoint_lower = endpoint.lower()
-        for always in self.config.always_capture_endpoints:
-            if endpoint_lower == always.lower() or endpoint_lower.startswith(always.lower()):
-                return True
+    def _sample_conditional(
+        self,
+        endpoint: str,
+        method: str,
+        request_body: Optional[Any],
+        query_params: Optional[Dict[str, Any]],
+    ) -> bool:
+        """Only capture errors and slow requests (handled before dispatch)."""
         return False
 
-    def _sample_random(self) -> bool:
+    def _sample_random(
+        self,
+        endpoint: str,
+        method: str,
+        request_body: Optional[Any],
+        query_params: Optional[Dict[str, Any]],
+    ) -> bool:
         """Simple random sampling."""
-        return random.random() < self.config.base_rate
+        return self._get_rng().random() < self._base_rate
+
+    def _get_rng(self) -> random.Random:
+        """Get this thread's RNG, creating it on first use."""
+        rng = getattr(self._rng_local, "rng", None)
+        if rng is None:
+            rng = self._rng_local.rng = random.Random(os.urandom(16))
+        return rng
 
     def _sample_clustering(
         self,
@@ -229,24 +586,30 @@ class Sampler:
         """
         # Create pattern hash from inputs
         pattern_key = self._create_pattern_hash(endpoint, method, request_body, query_params)
-        endpoint_key = f"{method}:{endpoint}"
-
-        with self._lock:
-            if endpoint_key not in self._seen_patterns:
-                self._seen_patterns[endpoint_key] = set()
-
-            seen = self._seen_patterns[endpoint_key]
+        endpoint_key = (_METHODS.get(method, method), endpoint)
+        lock, patterns, _ = self._shards[hash(endpoint_key) & 15]
+
+        with lock:
+            seen = patterns.get(endpoint_key)
+            if seen is None:
+                seen = patterns[endpoint_key] = set()
+                # Bound the number of endpoints tracked: evict the
+                # least-recently-used pattern set past the cap
+                if len(patterns) > self._max_endpoints_per_shard:
+                    patterns.popitem(last=False)
+            else:
+                patterns.move_to_end(endpoint_key)
 
             # New pattern - always capture (up to limit)
             if pattern_key not in seen:
-                if len(seen) < self.config.max_patterns_per_endpoint:
+                if len(seen) < self._max_patterns:
                     seen.add(pattern_key)
                     return True
                 # Over limit - fall back to random sampling
-                return random.random() < self.config.base_rate
+                return self._get_rng().random() < self._base_rate
 
             # Seen pattern - sample randomly
-            return random.random() < self.config.base_rate
+            return self._get_rng().random() < self._base_rate
 
     def _create_pattern_hash(
         self,
@@ -254,102 +617,167 @@ class Sampler:
         method: str,
         request_body: Optional[Any],
         query_params: Optional[Dict[str, Any]],
-    ) -> str:
-        """Create a hash representing the input pattern."""
-        # Hash structure, not values, for clustering
-        components = [method, endpoint]
+    ) -> int:
+        """
+        Create a hash representing the input pattern.
 
+        Patterns are only compared in-process, so the builtin tuple hash
+        (an int, no digest/hex string allocation) is sufficient and far
+        cheaper than a cryptographic hash.
+        """
+        # Hash structure, not values, for clustering
+        body_part: Optional[Any] = None
         if request_body is not None:
-            if isinstance(request_body, dict):
-                # Hash the keys (structure) not values
-                components.append(str(sorted(request_body.keys())))
+            body_type = type(request_body)
+            if body_type is dict:
+                # Hash the keys (structure) not values; iterating the
+                # dict directly skips the keys-view allocation
+                body_part = tuple(sorted(request_body))
             else:
-                components.append(type(request_body).__name__)
+                body_part = _BODY_TAGS.get(body_type)
+                if body_part is None:
+                    # Subclasses and uncommon types take the slow path
+                    if isinstance(request_body, dict):
+                        body_part = tuple(sorted(request_body))
+                    else:
+                        body_part = body_type.__name__
 
-        if query_params:
-            components.append(str(sorted(query_params.keys())))
+        query_part = tuple(sorted(query_params)) if query_params else None
 
-        pattern_str = "|".join(components)
-        return hashlib.md5(pattern_str.encode()).hexdigest()[:16]
+        return hash((method, endpoint, body_part, query_part))
 
-    def _sample_adaptive(self) -> bool:
+    def _sample_adaptive(
+        self,
+        endpoint: str,
+        method: str,
+        request_body: Optional[Any],
+        query_params: Optional[Dict[str, Any]],
+    ) -> bool:
         """
         Adaptive sampling that increases rate when errors occur.
 
         Maintains a sliding window of recent requests and adjusts
         sampling rate based on error rate.
         """
-        return random.random() < self._adaptive_rate
+        self._record_for_adaptive(is_error=False)
+        return self._get_rng().random() < self._adaptive_rate
 
     def _record_for_adaptive(self, is_error: bool) -> None:
         """Record a request for adaptive sampling calculations."""
-        if self.config.strategy != SamplingStrategy.ADAPTIVE:
+        if self._strategy is not SamplingStrategy.ADAPTIVE:
             return
 
-        now = time.time()
-        cutoff = now - self.config.adaptive_window_seconds
+        now = time.monotonic_ns()
+        cutoff = now - self._adaptive_window_ns
 
         with self._lock:
             # Add new record
-            self._recent_requests.append((now, is_error))
-
-            # Clean old records
-            self._recent_requests = [
-                (ts, err) for ts, err in self._recent_requests if ts > cutoff
-            ]
+            recent_ts = self._recent_ts
+            recent_err = self._recent_err
+            recent_ts.append(now)
+            recent_err.append(is_error)
+            if is_error:
+                self._error_count += 1
+
+            # Evict old records from the front; the deques are ordered by
+            # timestamp, so this is O(evicted) instead of an O(N) rebuild
+            while recent_ts and recent_ts[0] <= cutoff:
+                recent_ts.popleft()
+                if recent_err.popleft():
+                    self._error_count -= 1
 
             # Calculate error rate and adjust sampling
-            if len(self._recent_requests) > 0:
-                error_count = sum(1 for _, err in self._recent_requests if err)
-                error_rate = error_count / len(self._recent_requests)
+            if recent_ts:
+                error_rate = self._error_count / len(recent_ts)
 
                 # Increase sampling proportionally to error rate
                 if error_rate > 0:
-                    multiplier = 1 + (error_rate * self.config.adaptive_error_multiplier)
+                    multiplier = 1 + (error_rate * self._adaptive_multiplier)
                     self._adaptive_rate = min(
-                        self.config.base_rate * multiplier,
-                        self.config.adaptive_max_rate,
+                        self._base_rate * multiplier,
+                        self._adaptive_max_rate,
                     )
                 else:
-                    self._adaptive_rate = self.config.base_rate
+                    self._adaptive_rate = self._base_rate
 
-    def _sample_head(self, endpoint: str, method: str) -> bool:
+    def _sample_head(
+        self,
+        endpoint: str,
+        method: str,
+        request_body: Optional[Any],
+        query_params: Optional[Dict[str, Any]],
+    ) -> bool:
         """Capture first N requests per endpoint."""
-        endpoint_key = f"{method}:{endpoint}"
+        endpoint_key = (_METHODS.get(method, method), endpoint)
+        lock, _, counts = self._shards[hash(endpoint_key) & 15]
 
-        with self._lock:
-            count = self._head_counts.get(endpoint_key, 0)
+        counter = counts.get(endpoint_key)
+        if counter is None:
+            # Lock only to insert the counter; the increment itself is a
+            # single C-level next() call and needs no lock
+            with lock:
+                counter = counts.setdefault(endpoint_key, itertools.count())
 
-            if count < self.config.head_count:
-                self._head_counts[endpoint_key] = count + 1
-                return True
+        return next(counter) < self._head_count
 
-            return False
+    @staticmethod
+    def _counter_value(counter: Any) -> int:
+        """Read an itertools.count's next value without consuming it."""
+        return counter.__reduce__()[1][0]
 
     def get_stats(self) -> Dict[str, Any]:
         """Get sampling statistics."""
+        patterns_tracked: Dict[str, int] = {}
+        head_counts: Dict[str, int] = {}
+        for lock, patterns, counts in self._shards:
+            with lock:
+                # State is keyed on (method, endpoint) tuples; render the
+                # original "METHOD:/path" strings for reporting
+                for (method, endpoint), seen in patterns.items():
+                    patterns_tracked[f"{method}:{endpoint}"] = len(seen)
+                for (method, endpoint), counter in counts.items():
+                    # Counters keep advancing past the budget; cap for
+                    # reporting so stats match captures
+                    head_counts[f"{method}:{endpoint}"] = min(
+                        self._counter_value(counter), self._head_count
+                    )
+
         with self._lock:
             return {
                 "strategy": self.config.strategy.value,
                 "base_rate": self.config.base_rate,
-                "adaptive_rate": self._adaptive_rate if self.config.strategy == SamplingStrategy.ADAPTIVE else None,
-                "patterns_tracked": {k: len(v) for k, v in self._seen_patterns.items()},
-                "head_counts": dict(self._head_counts),
-                "recent_requests_window": len(self._recent_requests),
+                "adaptive_rate": self._adaptive_rate if self._strategy is SamplingStrategy.ADAPTIVE else None,
+                "patterns_tracked": patterns_tracked,
+                "head_counts": head_counts,
+                "recent_requests_window": len(self._recent_ts),
             }
 
     def reset(self) -> None:
         """Reset sampling state."""
+        for lock, patterns, counts in self._shards:
+            with lock:
+                patterns.clear()
+                counts.clear()
+
         with self._lock:
-            self._seen_patterns.clear()
-            self._head_counts.clear()
-            self._recent_requests.clear()
-            self._adaptive_rate = self.config.base_rate
+            self._recent_ts.clear()
+            self._recent_err.clear()
+            self._error_count = 0
+            self._adaptive_rate = self._base_rate
 
 
 # Global sampler instance
 _sampler: Optional[Sampler] = None
 
+# Bumped whenever the global sampler is replaced so cached references
+# (e.g. in the middleware) know to re-fetch it
+_sampler_version: int = 0
+
+
+def get_sampler_version() -> int:
+    """Get the current version of the global sampler instance."""
+    return _sampler_version
+
 
 def configure_sampling(config: SamplingConfig) -> Sampler:
     """
@@ -365,14 +793,16 @@ def configure_sampling(config: SamplingConfig) -> Sampler:
             base_rate=0.1,
         ))
     """
-    global _sampler
+    global _sampler, _sampler_version
     _sampler = Sampler(config)
+    _sampler_version += 1
     return _sampler
 
 
 def get_sampler() -> Sampler:
     """Get the global sampler instance."""
-    global _sampler
+    global _sampler, _sampler_version
     if _sampler is None:
         _sampler = Sampler()
+        _sampler_version += 1
     return _sampler
@@ -25,18 +25,159 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import gzip
+import hashlib
+import itertools
 import json
-from dataclasses import asdict, dataclass, field
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
+from heapq import merge
+from pathlib import Path
+from itertools import islice
 from threading import Lock
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
+from fastapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
+
+try:
+    # orjson is optional; when installed the dashboard API serializes its
+    # dict-heavy stats/requests payloads through it (2-3x faster than the
+    # stdlib encoder and bypasses jsonable_encoder)
+    import orjson
+    from fastapi.responses import ORJSONResponse as _DashboardJSONResponse
+except ImportError:
+    orjson = None
+    _DashboardJSONResponse = JSONResponse
+
+try:
+    # brotli is optional; JSON here is key-repetitive and compresses ~4-5x
+    # at quality 4, which is cheap enough for per-poll compression
+    import brotli
+except ImportError:
+    brotli = None
+
+# Don't bother compressing payloads smaller than this; the header
+# overhead and extra CPU outweigh the savings.
+_BROTLI_MIN_SIZE = 512
+
+
+def _maybe_brotli(request: Optional[Request], body: bytes) -> tuple[bytes, Dict[str, str]]:
+    """Brotli-compress a response body when the client accepts it."""
+    if (
+        brotli is not None
+        and request is not None
+        and len(body) >= _BROTLI_MIN_SIZE
+        and "br" in request.headers.get("accept-encoding", "")
+    ):
+        return brotli.compress(body, quality=4), {"Content-Encoding": "br"}
+    return body, {}
+
+
+def _json_response(data: Any, request: Optional[Request] = None) -> Response:
+    """
+    Serialize a payload straight to bytes and return a plain Response.
+
+    The dashboard's polled endpoints return plain dicts of primitives,
+    so they can skip FastAPI's jsonable_encoder/response-model pipeline
+    entirely and hand Starlette pre-built bytes - the bulk of the
+    per-request overhead on these routes. Passing the inbound request
+    additionally enables brotli compression for clients that accept it.
+    """
+    body, headers = _maybe_brotli(request, _json_bytes(data))
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _json_bytes(data: Any) -> bytes:
+    """Serialize a payload to JSON bytes (orjson when available)."""
+    if orjson is not None:
+        # Stats payloads key by_status on int status codes; stdlib json
+        # coerces those to strings but orjson refuses without this flag.
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode("utf-8")
+
+
+def _ndjson_line(data: Any) -> bytes:
+    """Serialize one NDJSON line (newline-terminated JSON bytes)."""
+    return _json_bytes(data) + b"\n"
+
+
+async def _request_json(request: Request) -> Dict[str, Any]:
+    """
+    Parse a JSON request body (orjson when available, {} when empty).
+
+    The settings endpoints accept partial bodies, so an empty body is a
+    valid no-op update rather than an error.
+    """
+    raw = await request.body()
+    if not raw:
+        return {}
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _etag_json_response(request: Request, body: bytes) -> Response:
+    """
+    Return JSON bytes with an ETag, or a bodyless 304 on a tag match.
+
+    The limit/endpoint payloads only change when config or counts move,
+    so a steady-state poll collapses to a 304 instead of re-shipping
+    kilobytes of identical JSON.
+    """
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    body, headers = _maybe_brotli(request, body)
+    headers["ETag"] = etag
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+# How long serialized limiter stats may be reused before recomputing.
+# Dashboards poll every 1-2 seconds; sub-second freshness buys nothing.
+_STATS_CACHE_TTL = 0.5
+
+
+def _limiter_stats_response(limiter: Any, request: Optional[Request] = None) -> Response:
+    """
+    Serve a limiter's full stats from a short-TTL byte cache.
+
+    Caches the serialized bytes rather than the dict, so polls within
+    the TTL skip both the locked aggregation and the JSON encode. When
+    the caller passes the inbound request, the cached bytes also back
+    an If-None-Match check. The cache keys on the limiter's config rev
+    as well as the TTL, so a mutation (enable/disable/set_config/reset)
+    is visible on the very next read instead of after the TTL.
+    """
+    now = time.monotonic()
+    rev = limiter._config_rev
+    cached_at, cached_rev, body = limiter._stats_cache
+    if cached_rev != rev or now - cached_at >= _STATS_CACHE_TTL:
+        body = _json_bytes(limiter.get_stats())
+        limiter._stats_cache = (now, rev, body)
+    if request is not None:
+        return _etag_json_response(request, body)
+    return Response(content=body, media_type="application/json")
 
-from fastapi import APIRouter, FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 
 from .fastapi import (
     CaptureConfig,
     _captured_requests,
+    _endpoint_counts,
+    add_capture_callback,
     get_capture_stats,
     get_captured_requests,
     clear_captured_requests,
@@ -46,10 +187,47 @@ from .sampling import (
     SamplingStrategy,
     Sampler,
     get_sampler,
+    get_sampler_version,
     configure_sampling,
 )
 
 
+# Sampling config snapshot keyed on the sampler version, which only moves
+# when configure_sampling replaces the global sampler - config polls reuse
+# the same dict until then
+_sampling_config_cache: tuple = (-1, None)
+
+
+
+def _format_alerts(alerts) -> List[Dict[str, Any]]:
+    """
+    Render raw alert records for output.
+
+    Alerts store raw time.time() floats and bare fields so the hot
+    (locked) path never builds datetime objects or formats prose; the
+    ISO timestamp and human-readable message are produced here, only
+    when alerts are actually serialized.
+    """
+    formatted = []
+    for alert in alerts:
+        alert = dict(alert)
+        alert["timestamp"] = datetime.fromtimestamp(
+            alert["timestamp"], tz=timezone.utc
+        ).isoformat()
+        if "function_name" in alert:
+            alert["message"] = (
+                f"Capture limit ({alert['limit']}) reached"
+                f" for function '{alert['function_name']}'"
+            )
+        else:
+            alert["message"] = (
+                f"Capture limit ({alert['limit']}) reached"
+                f" for type '{alert['type_value']}'"
+            )
+        formatted.append(alert)
+    return formatted
+
+
 # Function-based capture limits
 @dataclass
 class FunctionLimitConfig:
@@ -67,14 +245,36 @@ class FunctionLimitConfig:
     # Sample rate when limit reached (if action is "sample")
     overflow_sample_rate: float = 0.01
 
+    # Cap on distinct function names tracked in counts; new names beyond
+    # the cap are captured but not tracked (bounds memory on
+    # cardinality-explosion workloads, e.g. per-user function names)
+    max_tracked_keys: int = 100000
+
+    def __post_init__(self) -> None:
+        # Pre-decode the action so the hot path branches on a bool
+        # instead of re-running a string compare per request
+        self._action_is_stop = self.limit_action == "stop"
+        # Counts are sharded 16 ways, so the key cap applies per shard
+        self._max_keys_per_shard = max(1, self.max_tracked_keys // 16)
+        # Deterministic overflow sampling: capture every Nth overflow
+        # event instead of drawing from a PRNG on each one (0 = never)
+        rate = self.overflow_sample_rate
+        self._overflow_stride = max(1, int(round(1.0 / rate))) if rate > 0 else 0
+
 
-@dataclass
 class FunctionLimitState:
-    """Tracks capture counts per function name."""
-    
-    counts: Dict[str, int] = field(default_factory=dict)
-    alerts: List[Dict[str, Any]] = field(default_factory=list)
-    stopped_functions: Set[str] = field(default_factory=set)
+    """Tracks capture counts for one shard of function names."""
+
+    # Plain class with __slots__ rather than a dataclass: 16 shard
+    # instances per limiter, and slotted attribute access is faster on
+    # the hot path (dataclass slots=True needs Python 3.10+)
+    __slots__ = ("counts", "stopped_functions")
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {}
+        # Published as a new frozenset on each stop event so the hot path
+        # can do a lock-free membership test against a stable snapshot
+        self.stopped_functions: frozenset = frozenset()
 
 
 class FunctionLimiter:
@@ -86,23 +286,42 @@ class FunctionLimiter:
     
     def __init__(self, config: Optional[FunctionLimitConfig] = None):
         self.config = config or FunctionLimitConfig()
-        self._state = FunctionLimitState()
-        self._lock = Lock()
+        # State is sharded by hash(function_name) & 15 so concurrent
+        # event loops contend on different locks instead of serializing
+        # every should_capture call through one
+        self._locks = [Lock() for _ in range(16)]
+        self._states = [FunctionLimitState() for _ in range(16)]
+        # Alerts are rare (one per stop edge), so they stay in a single
+        # shared ring buffer behind their own lock
+        self._alerts: deque = deque(maxlen=10000)
+        self._alerts_lock = Lock()
+        # Shared overflow counter; itertools.count() increments are
+        # GIL-atomic so the stride draw needs no lock
+        self._overflow_counter = itertools.count()
         self._enabled = False
         self._function_configs: Dict[str, FunctionLimitConfig] = {}  # Per-function configs
-    
+        self._stats_cache: tuple = (0.0, -1, b"")  # (monotonic ts, config rev, serialized stats)
+        # Bumped on every mutation so cached stats never outlive a change
+        self._config_rev = 0
+
     def enable(self, function_name: Optional[str] = None, config: Optional[FunctionLimitConfig] = None) -> None:
         """Enable function limiting, optionally for specific function."""
+        global _FUNCTION_LIMITER_ENABLED
         self._enabled = True
+        _FUNCTION_LIMITER_ENABLED = True
         if function_name and config:
             self._function_configs[function_name] = config
-    
+        self._config_rev += 1
+
     def disable(self, function_name: Optional[str] = None) -> None:
         """Disable function limiting."""
+        global _FUNCTION_LIMITER_ENABLED
         if function_name:
             self._function_configs.pop(function_name, None)
         else:
             self._enabled = False
+            _FUNCTION_LIMITER_ENABLED = False
+        self._config_rev += 1
     
     def get_config(self, function_name: Optional[str] = None) -> FunctionLimitConfig:
         """Get config for function or default."""
@@ -116,7 +335,8 @@ class FunctionLimiter:
             self._function_configs[function_name] = config
         else:
             self.config = config
-    
+        self._config_rev += 1
+
     def should_capture(self, function_name: str) -> bool:
         """
         Check if function should be captured based on function limits.
@@ -126,114 +346,257 @@ class FunctionLimiter:
         """
         if not self._enabled:
             return True
-        
-        config = self.get_config(function_name)
-        
-        with self._lock:
+
+        # Inline get_config: the common deployment has no per-function
+        # overrides, so skip the method call and membership test
+        configs = self._function_configs
+        config = configs.get(function_name, self.config) if configs else self.config
+        limit = config.limit_per_function
+        bucket = hash(function_name) & 15
+        state = self._states[bucket]
+
+        # Lock-free fast path: dict reads and single-key int writes are
+        # atomic under the GIL, so requests comfortably below the limit
+        # never touch the lock. The limit boundary is re-checked under
+        # the shard lock below, so a racing increment can't push past it.
+        if function_name not in state.stopped_functions:
+            count = state.counts.get(function_name)
+            if count is None:
+                # Unseen name: capture without tracking once the key cap
+                # is hit, so counts can't grow unbounded
+                if len(state.counts) >= config._max_keys_per_shard:
+                    return True
+                count = 0
+            if count + 1 < limit:
+                state.counts[function_name] = count + 1
+                return True
+
+        with self._locks[bucket]:
             # Check if function is stopped
-            if function_name in self._state.stopped_functions:
-                if config.limit_action == "stop":
+            if function_name in state.stopped_functions:
+                if config._action_is_stop:
                     return False
-                # Sample at overflow rate
-                import random
-                return random.random() < config.overflow_sample_rate
-            
+                # Sample at the deterministic overflow stride
+                stride = config._overflow_stride
+                return stride > 0 and next(self._overflow_counter) % stride == 0
+
             # Get current count
-            count = self._state.counts.get(function_name, 0)
-            
+            count = state.counts.get(function_name)
+            if count is None:
+                if len(state.counts) >= config._max_keys_per_shard:
+                    return True
+                count = 0
+
             # Check limit BEFORE incrementing
-            if count >= config.limit_per_function:
+            if count >= limit:
                 # Ensure it's marked as stopped
-                if function_name not in self._state.stopped_functions:
-                    self._state.stopped_functions.add(function_name)
-                    if config.alert_on_limit:
-                        self._state.alerts.append({
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                            "function_name": function_name,
-                            "count": count,
-                            "message": f"Capture limit ({config.limit_per_function}) reached for function '{function_name}'",
-                        })
-                
+                state.stopped_functions = state.stopped_functions | {function_name}
+                if config.alert_on_limit:
+                    self._add_alert({
+                        "timestamp": time.time(),
+                        "function_name": function_name,
+                        "count": count,
+                        "limit": limit,
+                    })
+
                 # Don't capture - limit reached
-                if config.limit_action == "stop":
+                if config._action_is_stop:
                     return False
-                # Sample at very low rate if configured
-                import random
-                return random.random() < config.overflow_sample_rate
-            
-            # Only increment if we're below the limit and will capture
-            if count < config.limit_per_function:
-                self._state.counts[function_name] = count + 1
-                # Check if we just hit the limit after incrementing
-                if self._state.counts[function_name] >= config.limit_per_function:
-                    # Mark as stopped and create alert
-                    if function_name not in self._state.stopped_functions:
-                        self._state.stopped_functions.add(function_name)
+                # Sample at the deterministic overflow stride
+                stride = config._overflow_stride
+                return stride > 0 and next(self._overflow_counter) % stride == 0
+
+            # Below the limit: increment, and mark stopped if this
+            # capture consumed the last slot
+            count += 1
+            state.counts[function_name] = count
+            if count >= limit:
+                state.stopped_functions = state.stopped_functions | {function_name}
+                if config.alert_on_limit:
+                    self._add_alert({
+                        "timestamp": time.time(),
+                        "function_name": function_name,
+                        "count": count,
+                        "limit": limit,
+                    })
+            return True
+
+    def _add_alert(self, alert: Dict[str, Any]) -> None:
+        """Append to the shared alert ring buffer."""
+        with self._alerts_lock:
+            self._alerts.append(alert)
+        _event_broadcaster.publish("alert", alert)
+
+    def should_capture_many(self, function_names: List[str]) -> List[bool]:
+        """
+        Batched variant of should_capture for callers draining queued events.
+
+        Buckets the batch with Counter and applies limits per unique
+        function under one lock acquisition per touched shard instead of
+        one per event.
+
+        Returns:
+            Booleans aligned with function_names.
+        """
+        if not self._enabled:
+            return [True] * len(function_names)
+
+        quotas: Dict[str, int] = {}
+        overflow_strides: Dict[str, int] = {}
+
+        # Group unique names by shard so each shard lock is taken once
+        by_shard: Dict[int, List[tuple]] = {}
+        for name, n in Counter(function_names).items():
+            by_shard.setdefault(hash(name) & 15, []).append((name, n))
+
+        for bucket, entries in by_shard.items():
+            state = self._states[bucket]
+            with self._locks[bucket]:
+                for name, n in entries:
+                    config = self.get_config(name)
+
+                    if name in state.stopped_functions:
+                        quotas[name] = 0
+                        if not config._action_is_stop:
+                            overflow_strides[name] = config._overflow_stride
+                        continue
+
+                    count = state.counts.get(name)
+                    if count is None:
+                        if len(state.counts) >= config._max_keys_per_shard:
+                            quotas[name] = n
+                            continue
+                        count = 0
+                    allowed = min(n, config.limit_per_function - count)
+                    if allowed > 0:
+                        count += allowed
+                        state.counts[name] = count
+                    quotas[name] = allowed
+
+                    if count >= config.limit_per_function:
+                        state.stopped_functions = state.stopped_functions | {name}
                         if config.alert_on_limit:
-                            self._state.alerts.append({
-                                "timestamp": datetime.now(timezone.utc).isoformat(),
-                                "function_name": function_name,
-                                "count": self._state.counts[function_name],
-                                "message": f"Capture limit ({config.limit_per_function}) reached for function '{function_name}'",
+                            self._add_alert({
+                                "timestamp": time.time(),
+                                "function_name": name,
+                                "count": count,
+                                "limit": config.limit_per_function,
                             })
-                return True
-            
-            # Should never reach here, but just in case
-            return False
-    
+                        if not config._action_is_stop:
+                            overflow_strides[name] = config._overflow_stride
+
+        # Reconstruct per-event decisions from the per-name quotas
+        results: List[bool] = []
+        for name in function_names:
+            remaining = quotas[name]
+            if remaining > 0:
+                quotas[name] = remaining - 1
+                results.append(True)
+            elif name in overflow_strides:
+                stride = overflow_strides[name]
+                results.append(stride > 0 and next(self._overflow_counter) % stride == 0)
+            else:
+                results.append(False)
+        return results
+
     def get_stats(self) -> Dict[str, Any]:
-        """Get function limiting statistics."""
-        with self._lock:
-            return {
-                "enabled": self._enabled,
-                "config": {
-                    "limit_per_function": self.config.limit_per_function,
-                    "alert_on_limit": self.config.alert_on_limit,
-                    "limit_action": self.config.limit_action,
-                    "overflow_sample_rate": self.config.overflow_sample_rate,
-                },
-                "counts": dict(self._state.counts),
-                "stopped_functions": list(self._state.stopped_functions),
-                "alerts": list(self._state.alerts),
-                "function_configs": {
-                    fn: {
-                        "limit_per_function": c.limit_per_function,
-                    }
-                    for fn, c in self._function_configs.items()
-                },
-            }
-    
+        """Get function limiting statistics, merged across shards."""
+        counts: Dict[str, int] = {}
+        stopped: List[str] = []
+        for bucket, state in enumerate(self._states):
+            with self._locks[bucket]:
+                counts.update(state.counts)
+                stopped.extend(state.stopped_functions)
+        with self._alerts_lock:
+            alerts = _format_alerts(self._alerts)
+        return {
+            "enabled": self._enabled,
+            "config": {
+                "limit_per_function": self.config.limit_per_function,
+                "alert_on_limit": self.config.alert_on_limit,
+                "limit_action": self.config.limit_action,
+                "overflow_sample_rate": self.config.overflow_sample_rate,
+            },
+            "counts": counts,
+            "stopped_functions": stopped,
+            "alerts": alerts,
+            "function_configs": {
+                fn: {
+                    "limit_per_function": c.limit_per_function,
+                }
+                for fn, c in self._function_configs.items()
+            },
+        }
+
+    def get_stats_summary(self) -> Dict[str, Any]:
+        """
+        Cheap counts-only statistics for frequent polling.
+
+        Avoids the per-key dict and list copies get_stats makes, so
+        dashboard auto-refresh doesn't scale with tracked functions.
+        """
+        num_functions = num_stopped = total = 0
+        for bucket, state in enumerate(self._states):
+            with self._locks[bucket]:
+                num_functions += len(state.counts)
+                num_stopped += len(state.stopped_functions)
+                total += sum(state.counts.values())
+        return {
+            "enabled": self._enabled,
+            "num_functions": num_functions,
+            "num_stopped": num_stopped,
+            "num_alerts": len(self._alerts),
+            "total_captures": total,
+        }
+
     def get_alerts(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent alerts."""
-        with self._lock:
-            return list(reversed(self._state.alerts[-limit:]))
-    
+        with self._alerts_lock:
+            # deque supports O(1) reversed(), so newest-first emission is
+            # a single bounded pass with no intermediate slice copy
+            return _format_alerts(islice(reversed(self._alerts), limit))
+
     def clear_alerts(self) -> int:
         """Clear all alerts."""
-        with self._lock:
-            count = len(self._state.alerts)
-            self._state.alerts.clear()
-            return count
-    
+        with self._alerts_lock:
+            count = len(self._alerts)
+            self._alerts.clear()
+        self._config_rev += 1
+        return count
+
     def reset_function(self, function_name: str) -> bool:
         """Reset count for a specific function, allowing captures again."""
-        with self._lock:
-            if function_name in self._state.counts:
-                del self._state.counts[function_name]
-            self._state.stopped_functions.discard(function_name)
-            return True
-    
+        bucket = hash(function_name) & 15
+        state = self._states[bucket]
+        with self._locks[bucket]:
+            if function_name in state.counts:
+                del state.counts[function_name]
+            state.stopped_functions = state.stopped_functions - {function_name}
+        self._config_rev += 1
+        return True
+
     def reset_all(self) -> None:
         """Reset all function limiting state."""
-        with self._lock:
-            self._state.counts.clear()
-            self._state.stopped_functions.clear()
-            self._state.alerts.clear()
+        for bucket, state in enumerate(self._states):
+            with self._locks[bucket]:
+                state.counts.clear()
+                state.stopped_functions = frozenset()
+        self.clear_alerts()
 
 
 # Global function limiter instance
 _function_limiter: Optional[FunctionLimiter] = None
 
+# Mirrors the global limiter's enabled state so callers on the capture
+# path can skip the limiter entirely (one module-global read) when
+# function limiting was never turned on - the default deployment
+_FUNCTION_LIMITER_ENABLED = False
+
+
+def is_function_limiting_active() -> bool:
+    """Cheap check for whether function limiting is currently enabled."""
+    return _FUNCTION_LIMITER_ENABLED
+
 
 def get_function_limiter() -> FunctionLimiter:
     """Get the global function limiter instance."""
@@ -267,18 +630,45 @@ class TypeLimitConfig:
     
     # Action when limit reached: "stop" or "sample"
     limit_action: str = "stop"
-    
+
     # Sample rate when limit reached (if action is "sample")
     overflow_sample_rate: float = 0.01
 
+    # Cap on distinct type values tracked in counts; new values beyond
+    # the cap are captured but not tracked (bounds memory on
+    # cardinality-explosion workloads)
+    max_tracked_keys: int = 100000
+
+    def __post_init__(self) -> None:
+        # Precompute the path walk so extraction doesn't re-split the
+        # field path on every request; single-key paths (the common
+        # case) get a direct dict.get
+        self._path_parts = tuple(self.field_path.split("."))
+        self._is_simple = "." not in self.field_path
+        # Pre-decode the action so the hot path branches on a bool
+        # instead of re-running a string compare per request
+        self._action_is_stop = self.limit_action == "stop"
+        # Counts are sharded 16 ways, so the key cap applies per shard
+        self._max_keys_per_shard = max(1, self.max_tracked_keys // 16)
+        # Deterministic overflow sampling: capture every Nth overflow
+        # event instead of drawing from a PRNG on each one (0 = never)
+        rate = self.overflow_sample_rate
+        self._overflow_stride = max(1, int(round(1.0 / rate))) if rate > 0 else 0
+
 
-@dataclass
 class TypeLimitState:
-    """Tracks capture counts per type value."""
-    
-    counts: Dict[str, int] = field(default_factory=dict)
-    alerts: List[Dict[str, Any]] = field(default_factory=list)
-    stopped_types: Set[str] = field(default_factory=set)
+    """Tracks capture counts for one shard of type values."""
+
+    # Plain class with __slots__ rather than a dataclass: 16 shard
+    # instances per limiter, and slotted attribute access is faster on
+    # the hot path (dataclass slots=True needs Python 3.10+)
+    __slots__ = ("counts", "stopped_types")
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {}
+        # Published as a new frozenset on each stop event so the hot path
+        # can do a lock-free membership test against a stable snapshot
+        self.stopped_types: frozenset = frozenset()
 
 
 class TypeLimiter:
@@ -290,23 +680,38 @@ class TypeLimiter:
     
     def __init__(self, config: Optional[TypeLimitConfig] = None):
         self.config = config or TypeLimitConfig()
-        self._state = TypeLimitState()
-        self._lock = Lock()
+        # State is sharded by hash(type_value) & 15 so concurrent event
+        # loops contend on different locks instead of serializing every
+        # should_capture call through one
+        self._locks = [Lock() for _ in range(16)]
+        self._states = [TypeLimitState() for _ in range(16)]
+        # Alerts are rare (one per stop edge), so they stay in a single
+        # shared ring buffer behind their own lock
+        self._alerts: deque = deque(maxlen=10000)
+        self._alerts_lock = Lock()
+        # Shared overflow counter; itertools.count() increments are
+        # GIL-atomic so the stride draw needs no lock
+        self._overflow_counter = itertools.count()
         self._enabled = False
         self._endpoints: Dict[str, TypeLimitConfig] = {}  # Per-endpoint configs
-    
+        self._stats_cache: tuple = (0.0, -1, b"")  # (monotonic ts, config rev, serialized stats)
+        # Bumped on every config/enabled mutation; derived caches key on it
+        self._config_rev = 0
+
     def enable(self, endpoint: Optional[str] = None, config: Optional[TypeLimitConfig] = None) -> None:
         """Enable type limiting, optionally for specific endpoint."""
         self._enabled = True
         if endpoint and config:
             self._endpoints[endpoint] = config
-    
+        self._config_rev += 1
+
     def disable(self, endpoint: Optional[str] = None) -> None:
         """Disable type limiting."""
         if endpoint:
             self._endpoints.pop(endpoint, None)
         else:
             self._enabled = False
+        self._config_rev += 1
     
     def get_config(self, endpoint: Optional[str] = None) -> TypeLimitConfig:
         """Get config for endpoint or default."""
@@ -320,24 +725,25 @@ class TypeLimiter:
             self._endpoints[endpoint] = config
         else:
             self.config = config
+        self._config_rev += 1
     
-    def _extract_type_value(self, body: Any, field_path: str) -> Optional[str]:
-        """Extract type value from body using field path."""
-        if body is None:
-            return None
-        
+    def _extract_type_value(self, body: Any, config: TypeLimitConfig) -> Optional[str]:
+        """Extract type value from body using the config's field path."""
         if not isinstance(body, dict):
             return None
-        
-        parts = field_path.split(".")
+
+        # Fast path: single-key field paths need no walk at all
+        if config._is_simple:
+            value = body.get(config.field_path)
+            return str(value) if value is not None else None
+
         current = body
-        
-        for part in parts:
+        for part in config._path_parts:
             if isinstance(current, dict) and part in current:
                 current = current[part]
             else:
                 return None
-        
+
         return str(current) if current is not None else None
     
     def should_capture(
@@ -353,118 +759,311 @@ class TypeLimiter:
         """
         if not self._enabled:
             return True, None
-        
-        config = self.get_config(endpoint)
-        type_value = self._extract_type_value(request_body, config.field_path)
+
+        # Inline get_config: the common deployment has no per-endpoint
+        # overrides, so skip the method call and membership test
+        endpoints = self._endpoints
+        config = endpoints.get(endpoint, self.config) if endpoints else self.config
+        limit = config.limit_per_type
+        type_value = self._extract_type_value(request_body, config)
         
         if type_value is None:
             return True, None  # No type to limit on
-        
-        with self._lock:
+
+        bucket = hash(type_value) & 15
+        state = self._states[bucket]
+
+        # Lock-free fast path: dict reads and single-key int writes are
+        # atomic under the GIL, so requests comfortably below the limit
+        # never touch the lock. The limit boundary is re-checked under
+        # the shard lock below, so a racing increment can't push past it.
+        if type_value not in state.stopped_types:
+            count = state.counts.get(type_value)
+            if count is None:
+                # Unseen value: capture without tracking once the key cap
+                # is hit, so counts can't grow unbounded
+                if len(state.counts) >= config._max_keys_per_shard:
+                    return True, type_value
+                count = 0
+            if count + 1 < limit:
+                state.counts[type_value] = count + 1
+                return True, type_value
+
+        with self._locks[bucket]:
             # Check if type is stopped
-            if type_value in self._state.stopped_types:
-                if config.limit_action == "stop":
+            if type_value in state.stopped_types:
+                if config._action_is_stop:
                     return False, type_value
-                # Sample at overflow rate
-                import random
-                return random.random() < config.overflow_sample_rate, type_value
-            
+                # Sample at the deterministic overflow stride
+                stride = config._overflow_stride
+                return (stride > 0 and next(self._overflow_counter) % stride == 0), type_value
+
             # Get current count
-            count = self._state.counts.get(type_value, 0)
-            
+            count = state.counts.get(type_value)
+            if count is None:
+                if len(state.counts) >= config._max_keys_per_shard:
+                    return True, type_value
+                count = 0
+
             # Check limit BEFORE incrementing - if already at or over limit, don't capture
-            if count >= config.limit_per_type:
+            if count >= limit:
                 # Ensure it's marked as stopped
-                if type_value not in self._state.stopped_types:
-                    self._state.stopped_types.add(type_value)
-                    if config.alert_on_limit:
-                        self._state.alerts.append({
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                            "type_value": type_value,
-                            "count": count,
-                            "endpoint": endpoint,
-                            "message": f"Capture limit ({config.limit_per_type}) reached for type '{type_value}'",
-                        })
-                
+                state.stopped_types = state.stopped_types | {type_value}
+                if config.alert_on_limit:
+                    self._add_alert({
+                        "timestamp": time.time(),
+                        "type_value": type_value,
+                        "count": count,
+                        "endpoint": endpoint,
+                        "limit": limit,
+                    })
+
                 # Don't capture - limit reached
-                if config.limit_action == "stop":
+                if config._action_is_stop:
                     return False, type_value
-                # Sample at very low rate if configured
-                import random
-                return random.random() < config.overflow_sample_rate, type_value
-            
-            # Only increment if we're below the limit and will capture
-            # This ensures we never exceed the limit
-            if count < config.limit_per_type:
-                self._state.counts[type_value] = count + 1
-                # Check if we just hit the limit after incrementing
-                if self._state.counts[type_value] >= config.limit_per_type:
-                    # Mark as stopped and create alert
-                    if type_value not in self._state.stopped_types:
-                        self._state.stopped_types.add(type_value)
+                # Sample at the deterministic overflow stride
+                stride = config._overflow_stride
+                return (stride > 0 and next(self._overflow_counter) % stride == 0), type_value
+
+            # Below the limit: increment, and mark stopped if this
+            # capture consumed the last slot
+            count += 1
+            state.counts[type_value] = count
+            if count >= limit:
+                state.stopped_types = state.stopped_types | {type_value}
+                if config.alert_on_limit:
+                    self._add_alert({
+                        "timestamp": time.time(),
+                        "type_value": type_value,
+                        "count": count,
+                        "endpoint": endpoint,
+                        "limit": limit,
+                    })
+            return True, type_value
+
+    def _add_alert(self, alert: Dict[str, Any]) -> None:
+        """Append to the shared alert ring buffer."""
+        with self._alerts_lock:
+            self._alerts.append(alert)
+        _event_broadcaster.publish("alert", alert)
+
+    def should_capture_many(
+        self,
+        endpoint: str,
+        request_bodies: List[Any],
+    ) -> List[tuple[bool, Optional[str]]]:
+        """
+        Batched variant of should_capture for callers draining queued events.
+
+        Extracts type values up front, buckets them with Counter, and
+        applies limits per unique type under one lock acquisition per
+        touched shard.
+
+        Returns:
+            (should_capture, type_value) tuples aligned with request_bodies.
+        """
+        if not self._enabled:
+            return [(True, None)] * len(request_bodies)
+
+        config = self.get_config(endpoint)
+        values = [
+            self._extract_type_value(body, config)
+            for body in request_bodies
+        ]
+
+        quotas: Dict[str, int] = {}
+        overflow_strides: Dict[str, int] = {}
+
+        # Group unique values by shard so each shard lock is taken once
+        by_shard: Dict[int, List[tuple]] = {}
+        for value, n in Counter(v for v in values if v is not None).items():
+            by_shard.setdefault(hash(value) & 15, []).append((value, n))
+
+        for bucket, entries in by_shard.items():
+            state = self._states[bucket]
+            with self._locks[bucket]:
+                for value, n in entries:
+                    if value in state.stopped_types:
+                        quotas[value] = 0
+                        if not config._action_is_stop:
+                            overflow_strides[value] = config._overflow_stride
+                        continue
+
+                    count = state.counts.get(value)
+                    if count is None:
+                        if len(state.counts) >= config._max_keys_per_shard:
+                            quotas[value] = n
+                            continue
+                        count = 0
+                    allowed = min(n, config.limit_per_type - count)
+                    if allowed > 0:
+                        count += allowed
+                        state.counts[value] = count
+                    quotas[value] = allowed
+
+                    if count >= config.limit_per_type:
+                        state.stopped_types = state.stopped_types | {value}
                         if config.alert_on_limit:
-                            self._state.alerts.append({
-                                "timestamp": datetime.now(timezone.utc).isoformat(),
-                                "type_value": type_value,
-                                "count": self._state.counts[type_value],
+                            self._add_alert({
+                                "timestamp": time.time(),
+                                "type_value": value,
+                                "count": count,
                                 "endpoint": endpoint,
-                                "message": f"Capture limit ({config.limit_per_type}) reached for type '{type_value}'",
+                                "limit": config.limit_per_type,
                             })
-                return True, type_value
-            
-            # Should never reach here, but just in case
-            return False, type_value
-    
+                        if not config._action_is_stop:
+                            overflow_strides[value] = config._overflow_stride
+
+        # Reconstruct per-event decisions from the per-type quotas
+        results: List[tuple[bool, Optional[str]]] = []
+        for value in values:
+            if value is None:
+                results.append((True, None))
+                continue
+            remaining = quotas[value]
+            if remaining > 0:
+                quotas[value] = remaining - 1
+                results.append((True, value))
+            elif value in overflow_strides:
+                stride = overflow_strides[value]
+                results.append((stride > 0 and next(self._overflow_counter) % stride == 0, value))
+            else:
+                results.append((False, value))
+        return results
+
     def get_stats(self) -> Dict[str, Any]:
-        """Get type limiting statistics."""
-        with self._lock:
-            return {
-                "enabled": self._enabled,
-                "config": {
-                    "field_path": self.config.field_path,
-                    "limit_per_type": self.config.limit_per_type,
-                    "alert_on_limit": self.config.alert_on_limit,
-                    "limit_action": self.config.limit_action,
-                    "overflow_sample_rate": self.config.overflow_sample_rate,
-                },
-                "counts": dict(self._state.counts),
-                "stopped_types": list(self._state.stopped_types),
-                "alerts": list(self._state.alerts),
-                "endpoint_configs": {
-                    ep: {
-                        "field_path": c.field_path,
-                        "limit_per_type": c.limit_per_type,
-                    }
-                    for ep, c in self._endpoints.items()
-                },
-            }
-    
+        """Get type limiting statistics, merged across shards."""
+        counts: Dict[str, int] = {}
+        stopped: List[str] = []
+        for bucket, state in enumerate(self._states):
+            with self._locks[bucket]:
+                counts.update(state.counts)
+                stopped.extend(state.stopped_types)
+        with self._alerts_lock:
+            alerts = _format_alerts(self._alerts)
+        return {
+            "enabled": self._enabled,
+            "config": {
+                "field_path": self.config.field_path,
+                "limit_per_type": self.config.limit_per_type,
+                "alert_on_limit": self.config.alert_on_limit,
+                "limit_action": self.config.limit_action,
+                "overflow_sample_rate": self.config.overflow_sample_rate,
+            },
+            "counts": counts,
+            "stopped_types": stopped,
+            "alerts": alerts,
+            "endpoint_configs": {
+                ep: {
+                    "field_path": c.field_path,
+                    "limit_per_type": c.limit_per_type,
+                }
+                for ep, c in self._endpoints.items()
+            },
+        }
+
+    def get_stats_summary(self) -> Dict[str, Any]:
+        """
+        Cheap counts-only statistics for frequent polling.
+
+        Avoids the per-key dict and list copies get_stats makes, so
+        dashboard auto-refresh doesn't scale with tracked types.
+        """
+        num_types = num_stopped = total = 0
+        for bucket, state in enumerate(self._states):
+            with self._locks[bucket]:
+                num_types += len(state.counts)
+                num_stopped += len(state.stopped_types)
+                total += sum(state.counts.values())
+        return {
+            "enabled": self._enabled,
+            "num_types": num_types,
+            "num_stopped": num_stopped,
+            "num_alerts": len(self._alerts),
+            "total_captures": total,
+        }
+
     def get_alerts(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent alerts."""
-        with self._lock:
-            return list(reversed(self._state.alerts[-limit:]))
-    
+        with self._alerts_lock:
+            # deque supports O(1) reversed(), so newest-first emission is
+            # a single bounded pass with no intermediate slice copy
+            return _format_alerts(islice(reversed(self._alerts), limit))
+
     def clear_alerts(self) -> int:
         """Clear all alerts."""
-        with self._lock:
-            count = len(self._state.alerts)
-            self._state.alerts.clear()
-            return count
-    
+        with self._alerts_lock:
+            count = len(self._alerts)
+            self._alerts.clear()
+        self._config_rev += 1
+        return count
+
     def reset_type(self, type_value: str) -> bool:
         """Reset count for a specific type, allowing captures again."""
-        with self._lock:
-            if type_value in self._state.counts:
-                del self._state.counts[type_value]
-            self._state.stopped_types.discard(type_value)
-            return True
-    
+        bucket = hash(type_value) & 15
+        state = self._states[bucket]
+        with self._locks[bucket]:
+            if type_value in state.counts:
+                del state.counts[type_value]
+            state.stopped_types = state.stopped_types - {type_value}
+        self._config_rev += 1
+        return True
+
     def reset_all(self) -> None:
         """Reset all type limiting state."""
+        for bucket, state in enumerate(self._states):
+            with self._locks[bucket]:
+                state.counts.clear()
+                state.stopped_types = frozenset()
+        self.clear_alerts()
+
+
+class EventBroadcaster:
+    """
+    Fans dashboard mutation events out to SSE subscribers.
+
+    Publishers may run on worker threads (limiter stop edges) or on the
+    event loop (route handlers); frames are handed to each subscriber's
+    queue via call_soon_threadsafe so either is safe. When nobody is
+    subscribed, publish() is a single truthiness check.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: List[tuple] = []  # (loop, queue) pairs
+        self._lock = Lock()
+
+    @property
+    def active(self) -> bool:
+        return bool(self._subscribers)
+
+    def subscribe(self) -> "asyncio.Queue":
+        """Register the calling event loop and return its frame queue."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=256)
         with self._lock:
-            self._state.counts.clear()
-            self._state.stopped_types.clear()
-            self._state.alerts.clear()
+            self._subscribers.append((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, queue: "asyncio.Queue") -> None:
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s[1] is not queue]
+
+    def publish(self, event: str, data: Any) -> None:
+        """Serialize once and enqueue an SSE frame for every subscriber."""
+        if not self._subscribers:
+            return
+        frame = f"event: {event}\ndata: {json.dumps(data)}\n\n"
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, frame)
+            except RuntimeError:
+                # Loop already closed; the subscriber is gone
+                pass
+
+
+# Global event broadcaster for the dashboard's SSE stream
+_event_broadcaster = EventBroadcaster()
 
 
 # Global type limiter instance
@@ -487,1352 +1086,319 @@ def configure_type_limits(config: TypeLimitConfig) -> TypeLimiter:
     return _type_limiter
 
 
-# Dashboard HTML
-DASHBOARD_HTML = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Chronicle Dashboard</title>
-    <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;500;600&family=Space+Grotesk:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        :root {
-            --bg-primary: #0a0e14;
-            --bg-secondary: #11151c;
-            --bg-tertiary: #1a1f28;
-            --bg-card: #151a23;
-            --border-color: #2d3640;
-            --text-primary: #e6e9ed;
-            --text-secondary: #8b95a5;
-            --text-muted: #5c6675;
-            --accent-cyan: #39bae6;
-            --accent-green: #7fd962;
-            --accent-orange: #ff9940;
-            --accent-red: #f07178;
-            --accent-purple: #c792ea;
-            --accent-yellow: #ffb454;
-            --shadow: 0 4px 24px rgba(0,0,0,0.4);
-        }
-        
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Space Grotesk', sans-serif;
-            background: var(--bg-primary);
-            color: var(--text-primary);
-            min-height: 100vh;
-            background-image: 
-                radial-gradient(ellipse at 20% 0%, rgba(57, 186, 230, 0.08) 0%, transparent 50%),
-                radial-gradient(ellipse at 80% 100%, rgba(199, 146, 234, 0.06) 0%, transparent 50%);
-        }
-        
-        .header {
-            background: var(--bg-secondary);
-            border-bottom: 1px solid var(--border-color);
-            padding: 1rem 2rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .logo {
-            display: flex;
-            align-items: center;
-            gap: 0.75rem;
-        }
-        
-        .logo-icon {
-            width: 32px;
-            height: 32px;
-            background: linear-gradient(135deg, var(--accent-cyan), var(--accent-purple));
-            border-radius: 8px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: 700;
-            font-size: 18px;
-        }
-        
-        .logo h1 {
-            font-size: 1.25rem;
-            font-weight: 600;
-            background: linear-gradient(135deg, var(--accent-cyan), var(--accent-purple));
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-        }
-        
-        .header-actions {
-            display: flex;
-            gap: 0.75rem;
-        }
-        
-        .btn {
-            font-family: 'Space Grotesk', sans-serif;
-            padding: 0.5rem 1rem;
-            border-radius: 6px;
-            border: 1px solid var(--border-color);
-            background: var(--bg-tertiary);
-            color: var(--text-primary);
-            cursor: pointer;
-            font-size: 0.875rem;
-            font-weight: 500;
-            transition: all 0.2s ease;
-        }
-        
-        .btn:hover {
-            background: var(--bg-card);
-            border-color: var(--accent-cyan);
-        }
-        
-        .btn-primary {
-            background: linear-gradient(135deg, var(--accent-cyan), var(--accent-purple));
-            border: none;
-            color: var(--bg-primary);
-        }
-        
-        .btn-primary:hover {
-            opacity: 0.9;
-        }
-        
-        .btn-danger {
-            border-color: var(--accent-red);
-            color: var(--accent-red);
-        }
-        
-        .btn-danger:hover {
-            background: rgba(240, 113, 120, 0.15);
-        }
-        
-        .main {
-            padding: 2rem;
-            max-width: 1600px;
-            margin: 0 auto;
-        }
-        
-        .grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(320px, 1fr));
-            gap: 1.5rem;
-            margin-bottom: 2rem;
-        }
-        
-        .card {
-            background: var(--bg-card);
-            border: 1px solid var(--border-color);
-            border-radius: 12px;
-            padding: 1.5rem;
-            box-shadow: var(--shadow);
-        }
-        
-        .card-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 1rem;
-        }
-        
-        .card-title {
-            font-size: 0.875rem;
-            font-weight: 600;
-            color: var(--text-secondary);
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-        }
-        
-        .card-badge {
-            font-size: 0.75rem;
-            padding: 0.25rem 0.5rem;
-            border-radius: 4px;
-            font-weight: 500;
-        }
-        
-        .badge-active {
-            background: rgba(127, 217, 98, 0.15);
-            color: var(--accent-green);
-        }
-        
-        .badge-warning {
-            background: rgba(255, 153, 64, 0.15);
-            color: var(--accent-orange);
-        }
-        
-        .badge-error {
-            background: rgba(240, 113, 120, 0.15);
-            color: var(--accent-red);
-        }
-        
-        .stat-value {
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 2.5rem;
-            font-weight: 600;
-            color: var(--accent-cyan);
-            line-height: 1;
-        }
-        
-        .stat-label {
-            font-size: 0.875rem;
-            color: var(--text-muted);
-            margin-top: 0.5rem;
-        }
-        
-        .stat-grid {
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 1rem;
-            margin-top: 1rem;
-        }
-        
-        .stat-item {
-            padding: 0.75rem;
-            background: var(--bg-tertiary);
-            border-radius: 8px;
-        }
-        
-        .stat-item-value {
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 1.25rem;
-            font-weight: 600;
-            color: var(--text-primary);
-        }
-        
-        .stat-item-label {
-            font-size: 0.75rem;
-            color: var(--text-muted);
-        }
-        
-        .form-group {
-            margin-bottom: 1rem;
-        }
-        
-        .form-label {
-            display: block;
-            font-size: 0.8125rem;
-            font-weight: 500;
-            color: var(--text-secondary);
-            margin-bottom: 0.5rem;
-        }
-        
-        .form-input, .form-select {
-            width: 100%;
-            padding: 0.625rem 0.875rem;
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 0.875rem;
-            background: var(--bg-tertiary);
-            border: 1px solid var(--border-color);
-            border-radius: 6px;
-            color: var(--text-primary);
-            transition: border-color 0.2s ease;
-        }
-        
-        .form-input:focus, .form-select:focus {
-            outline: none;
-            border-color: var(--accent-cyan);
-        }
-        
-        .form-select {
-            cursor: pointer;
-        }
-        
-        .form-row {
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 1rem;
-        }
-        
-        .toggle {
-            display: flex;
-            align-items: center;
-            gap: 0.75rem;
-            cursor: pointer;
-        }
-        
-        .toggle-switch {
-            position: relative;
-            width: 44px;
-            height: 24px;
-            background: var(--bg-tertiary);
-            border: 1px solid var(--border-color);
-            border-radius: 12px;
-            transition: all 0.2s ease;
-        }
-        
-        .toggle-switch::after {
-            content: '';
-            position: absolute;
-            top: 3px;
-            left: 3px;
-            width: 16px;
-            height: 16px;
-            background: var(--text-muted);
-            border-radius: 50%;
-            transition: all 0.2s ease;
-        }
-        
-        .toggle.active .toggle-switch {
-            background: var(--accent-cyan);
-            border-color: var(--accent-cyan);
-        }
-        
-        .toggle.active .toggle-switch::after {
-            left: 23px;
-            background: var(--bg-primary);
-        }
-        
-        .toggle-label {
-            font-size: 0.875rem;
-            color: var(--text-secondary);
-        }
-        
-        .alert-list {
-            max-height: 300px;
-            overflow-y: auto;
-        }
-        
-        .alert-item {
-            display: flex;
-            align-items: flex-start;
-            gap: 0.75rem;
-            padding: 0.875rem;
-            background: var(--bg-tertiary);
-            border-radius: 8px;
-            margin-bottom: 0.5rem;
-            border-left: 3px solid var(--accent-orange);
-        }
-        
-        .alert-icon {
-            font-size: 1.25rem;
-        }
-        
-        .alert-content {
-            flex: 1;
-        }
-        
-        .alert-message {
-            font-size: 0.875rem;
-            color: var(--text-primary);
-            margin-bottom: 0.25rem;
-        }
-        
-        .alert-time {
-            font-size: 0.75rem;
-            color: var(--text-muted);
-            font-family: 'JetBrains Mono', monospace;
-        }
-        
-        .alert-action {
-            padding: 0.25rem 0.5rem;
-            font-size: 0.75rem;
-        }
-        
-        .type-list {
-            max-height: 350px;
-            overflow-y: auto;
-        }
-        
-        .type-item {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 0.75rem;
-            background: var(--bg-tertiary);
-            border-radius: 8px;
-            margin-bottom: 0.5rem;
-        }
-        
-        .type-info {
-            display: flex;
-            align-items: center;
-            gap: 0.75rem;
-        }
-        
-        .type-name {
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 0.875rem;
-            color: var(--text-primary);
-        }
-        
-        .type-count {
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 0.875rem;
-            color: var(--accent-cyan);
-        }
-        
-        .type-status {
-            font-size: 0.75rem;
-            padding: 0.25rem 0.5rem;
-            border-radius: 4px;
-        }
-        
-        .type-status.active {
-            background: rgba(127, 217, 98, 0.15);
-            color: var(--accent-green);
-        }
-        
-        .type-status.stopped {
-            background: rgba(240, 113, 120, 0.15);
-            color: var(--accent-red);
-        }
-        
-        .progress-bar {
-            height: 6px;
-            background: var(--bg-tertiary);
-            border-radius: 3px;
-            overflow: hidden;
-            margin-top: 0.5rem;
-        }
-        
-        .progress-fill {
-            height: 100%;
-            border-radius: 3px;
-            transition: width 0.3s ease;
-        }
-        
-        .progress-fill.low { background: var(--accent-green); }
-        .progress-fill.medium { background: var(--accent-yellow); }
-        .progress-fill.high { background: var(--accent-orange); }
-        .progress-fill.full { background: var(--accent-red); }
-        
-        .empty-state {
-            text-align: center;
-            padding: 2rem;
-            color: var(--text-muted);
-        }
-        
-        .empty-state-icon {
-            font-size: 2rem;
-            margin-bottom: 0.5rem;
-            opacity: 0.5;
-        }
-        
-        .requests-table {
-            width: 100%;
-            border-collapse: collapse;
-        }
-        
-        .requests-table th,
-        .requests-table td {
-            padding: 0.75rem;
-            text-align: left;
-            border-bottom: 1px solid var(--border-color);
-        }
-        
-        .requests-table th {
-            font-size: 0.75rem;
-            font-weight: 600;
-            color: var(--text-muted);
-            text-transform: uppercase;
-        }
-        
-        .requests-table td {
-            font-size: 0.875rem;
-            font-family: 'JetBrains Mono', monospace;
-        }
-        
-        .method {
-            padding: 0.25rem 0.5rem;
-            border-radius: 4px;
-            font-size: 0.75rem;
-            font-weight: 600;
-        }
-        
-        .method-get { background: rgba(127, 217, 98, 0.15); color: var(--accent-green); }
-        .method-post { background: rgba(57, 186, 230, 0.15); color: var(--accent-cyan); }
-        .method-put { background: rgba(255, 180, 84, 0.15); color: var(--accent-yellow); }
-        .method-delete { background: rgba(240, 113, 120, 0.15); color: var(--accent-red); }
-        
-        .status-2xx { color: var(--accent-green); }
-        .status-4xx { color: var(--accent-orange); }
-        .status-5xx { color: var(--accent-red); }
-        
-        .refresh-indicator {
-            display: inline-flex;
-            align-items: center;
-            gap: 0.5rem;
-            font-size: 0.75rem;
-            color: var(--text-muted);
-        }
-        
-        .refresh-dot {
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-            background: var(--accent-green);
-            animation: pulse 2s infinite;
-        }
-        
-        @keyframes pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.4; }
-        }
-        
-        .tabs {
-            display: flex;
-            gap: 0.25rem;
-            background: var(--bg-tertiary);
-            padding: 0.25rem;
-            border-radius: 8px;
-            margin-bottom: 1rem;
-        }
-        
-        .tab {
-            flex: 1;
-            padding: 0.625rem 1rem;
-            background: transparent;
-            border: none;
-            border-radius: 6px;
-            font-family: 'Space Grotesk', sans-serif;
-            font-size: 0.875rem;
-            font-weight: 500;
-            color: var(--text-muted);
-            cursor: pointer;
-            transition: all 0.2s ease;
-        }
-        
-        .tab:hover {
-            color: var(--text-secondary);
-        }
-        
-        .tab.active {
-            background: var(--bg-card);
-            color: var(--text-primary);
-        }
-        
-        .endpoint-config {
-            padding: 1rem;
-            background: var(--bg-tertiary);
-            border-radius: 8px;
-            margin-bottom: 1rem;
-        }
-        
-        .endpoint-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 0.75rem;
-        }
-        
-        .endpoint-path {
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 0.875rem;
-            color: var(--accent-cyan);
-        }
-        
-        ::-webkit-scrollbar {
-            width: 6px;
-            height: 6px;
-        }
-        
-        ::-webkit-scrollbar-track {
-            background: var(--bg-tertiary);
-            border-radius: 3px;
-        }
-        
-        ::-webkit-scrollbar-thumb {
-            background: var(--border-color);
-            border-radius: 3px;
-        }
-        
-        ::-webkit-scrollbar-thumb:hover {
-            background: var(--text-muted);
-        }
-    </style>
-</head>
-<body>
-    <header class="header">
-        <div class="logo">
-            <div class="logo-icon">C</div>
-            <h1>Chronicle Dashboard</h1>
-        </div>
-        <div class="header-actions">
-            <div class="refresh-indicator">
-                <span class="refresh-dot"></span>
-                <span>Auto-refresh: <span id="refresh-interval">5s</span></span>
-            </div>
-            <button class="btn" onclick="refreshAll()">↻ Refresh</button>
-            <button class="btn btn-danger" onclick="clearCaptures()">Clear All</button>
-        </div>
-    </header>
-    
-    <main class="main">
-        <div class="grid">
-            <!-- Capture Stats Card -->
-            <div class="card">
-                <div class="card-header">
-                    <span class="card-title">Capture Stats</span>
-                    <span class="card-badge badge-active" id="capture-status">Active</span>
-                </div>
-                <div class="stat-value" id="total-captured">0</div>
-                <div class="stat-label">Total Captured Requests</div>
-                <div class="stat-grid">
-                    <div class="stat-item">
-                        <div class="stat-item-value" id="stat-errors">0</div>
-                        <div class="stat-item-label">Errors</div>
-                    </div>
-                    <div class="stat-item">
-                        <div class="stat-item-value" id="stat-avg-duration">0ms</div>
-                        <div class="stat-item-label">Avg Duration</div>
-                    </div>
-                    <div class="stat-item">
-                        <div class="stat-item-value" id="stat-error-rate">0%</div>
-                        <div class="stat-item-label">Error Rate</div>
-                    </div>
-                    <div class="stat-item">
-                        <div class="stat-item-value" id="stat-strategy">random</div>
-                        <div class="stat-item-label">Strategy</div>
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Sampling Settings Card -->
-            <div class="card">
-                <div class="card-header">
-                    <span class="card-title">Sampling Settings</span>
-                </div>
-                <div class="form-group">
-                    <label class="form-label" title="Algorithm used to decide which requests to capture">Strategy</label>
-                    <select class="form-select" id="sampling-strategy" onchange="updateSamplingSettings()">
-                        <option value="all" title="Capture 100% of all traffic">All (No Sampling)</option>
-                        <option value="random" title="Capture a random percentage of traffic">Random</option>
-                        <option value="clustering" title="Capture diverse patterns by hashing input structure">Clustering</option>
-                        <option value="adaptive" title="Increase sampling rate automatically when error rates spike">Adaptive</option>
-                        <option value="head" title="Capture the first N requests for each unique endpoint">Head (First N)</option>
-                        <option value="conditional" title="Only capture errors or slow requests">Conditional Only</option>
-                    </select>
-                </div>
-                <div class="form-row">
-                    <div class="form-group">
-                        <label class="form-label" title="Baseline capture rate (e.g. 0.1 = 10% of traffic)">Base Rate</label>
-                        <input type="number" class="form-input" id="base-rate" 
-                               min="0" max="1" step="0.01" value="0.1"
-                               onchange="updateSamplingSettings()">
-                    </div>
-                    <div class="form-group">
-                        <label class="form-label" title="Requests slower than this are considered 'slow'">Latency Threshold (ms)</label>
-                        <input type="number" class="form-input" id="latency-threshold" 
-                               min="0" step="100" value="1000"
-                               onchange="updateSamplingSettings()">
-                    </div>
-                </div>
-                <div class="toggle" id="toggle-errors" onclick="toggleErrors()" title="Always capture 4xx/5xx responses regardless of sampling">
-                    <div class="toggle-switch"></div>
-                    <span class="toggle-label">Always capture errors</span>
-                </div>
-                <div class="toggle" id="toggle-slow" onclick="toggleSlow()" style="margin-top: 0.75rem;" title="Always capture requests exceeding latency threshold regardless of sampling">
-                    <div class="toggle-switch"></div>
-                    <span class="toggle-label">Always capture slow requests</span>
-                </div>
-            </div>
-            
-            <!-- Function Limiting Card -->
-            <div class="card">
-                <div class="card-header">
-                    <span class="card-title">Function-Based Limits</span>
-                    <span class="card-badge" id="function-limit-status">Disabled</span>
-                </div>
-                <div class="toggle" id="toggle-function-limits" onclick="toggleFunctionLimits()" style="margin-bottom: 1rem;" title="Enable capture quotas per function name">
-                    <div class="toggle-switch"></div>
-                    <span class="toggle-label">Enable function-based limiting</span>
-                </div>
-                <div class="form-row">
-                    <div class="form-group">
-                        <label class="form-label" title="Maximum number of captures to keep per function">Limit Per Function</label>
-                        <input type="number" class="form-input" id="function-limit-per-function" 
-                               min="1" step="100" value="5000"
-                               onchange="updateFunctionLimitSettings()">
-                    </div>
-                    <div class="form-group">
-                        <label class="form-label" title="What to do once the limit for a function is reached">On Limit</label>
-                        <select class="form-select" id="function-limit-action" onchange="updateFunctionLimitSettings()">
-                            <option value="stop" title="Stop recording this function until reset">Stop Recording</option>
-                            <option value="sample" title="Continue recording this function but at a very low sampling rate">Sample at Low Rate</option>
-                        </select>
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Type Limiting Card -->
-            <div class="card">
-                <div class="card-header">
-                    <span class="card-title">Type-Based Limits</span>
-                    <span class="card-badge" id="type-limit-status">Disabled</span>
-                </div>
-                <div class="toggle" id="toggle-type-limits" onclick="toggleTypeLimits()" style="margin-bottom: 1rem;" title="Enable granular capture quotas based on payload field values">
-                    <div class="toggle-switch"></div>
-                    <span class="toggle-label">Enable type-based limiting</span>
-                </div>
-                <div class="form-group">
-                    <label class="form-label" title="JSON path to extract the category value (e.g. 'type' or 'payload.event_type')">Field Path (e.g., "type", "event.type")</label>
-                    <input type="text" class="form-input" id="type-field-path" 
-                           value="type" onchange="updateTypeLimitSettings()">
-                </div>
-                <div class="form-row">
-                    <div class="form-group">
-                        <label class="form-label" title="Maximum number of captures to keep for each unique type value">Limit Per Type</label>
-                        <input type="number" class="form-input" id="limit-per-type" 
-                               min="1" step="100" value="5000"
-                               onchange="updateTypeLimitSettings()">
-                    </div>
-                    <div class="form-group">
-                        <label class="form-label" title="What to do once the limit for a specific type is reached">On Limit</label>
-                        <select class="form-select" id="limit-action" onchange="updateTypeLimitSettings()">
-                            <option value="stop" title="Stop recording this specific type until reset">Stop Recording</option>
-                            <option value="sample" title="Continue recording this type but at a very low sampling rate">Sample at Low Rate</option>
-                        </select>
-                    </div>
-                </div>
-                
-                <!-- Code Example Preview -->
-                <div style="margin-top: 1.5rem; padding: 1rem; background: var(--bg-tertiary); border-radius: 8px; border: 1px solid var(--border-color);">
-                    <div style="font-size: 0.75rem; font-weight: 600; color: var(--text-secondary); text-transform: uppercase; margin-bottom: 0.75rem; letter-spacing: 0.05em;">Code Configuration Example</div>
-                    <pre style="margin: 0; font-family: 'JetBrains Mono', monospace; font-size: 0.75rem; color: var(--text-primary); overflow-x: auto; line-height: 1.6;"><code id="type-limit-code-example">from Chronicle.integrations import configure_type_limits, TypeLimitConfig
-
-configure_type_limits(TypeLimitConfig(
-    field_path="type",
-    limit_per_type=5000,
-    alert_on_limit=True,
-    limit_action="stop",
-))</code></pre>
-                    <div style="margin-top: 0.5rem; font-size: 0.7rem; color: var(--text-muted);">
-                        Copy this code to your application startup to configure type-based limits programmatically.
-                    </div>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Endpoint Management -->
-        <div class="card">
-            <div class="card-header">
-                <span class="card-title">Endpoint Configuration</span>
-                <button class="btn" onclick="refreshEndpoints()">↻ Refresh</button>
-            </div>
-            <div style="margin-bottom: 1rem;">
-                <div class="form-group">
-                    <label class="form-label">Filter Endpoints</label>
-                    <input type="text" class="form-input" id="endpoint-filter" 
-                           placeholder="Search endpoints..." oninput="filterEndpoints()">
-                </div>
-            </div>
-            <div class="type-list" id="endpoint-list" style="max-height: 400px;">
-                <div class="empty-state">
-                    <div class="empty-state-icon">🔍</div>
-                    <div>Loading endpoints...</div>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Function & Type Counts Row -->
-        <div class="grid">
-            <!-- Function Counts -->
-            <div class="card">
-                <div class="card-header">
-                    <span class="card-title">Captures by Function</span>
-                    <button class="btn" onclick="resetAllFunctions()">Reset All</button>
-                </div>
-                <div class="type-list" id="function-list">
-                    <div class="empty-state">
-                        <div class="empty-state-icon">📊</div>
-                        <div>No function data yet</div>
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Type Counts -->
-            <div class="card">
-                <div class="card-header">
-                    <span class="card-title">Captures by Type</span>
-                    <button class="btn" onclick="resetAllTypes()">Reset All</button>
-                </div>
-                <div class="type-list" id="type-list">
-                    <div class="empty-state">
-                        <div class="empty-state-icon">📊</div>
-                        <div>No type data yet</div>
-                    </div>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Alerts -->
-        <div class="card">
-            <div class="card-header">
-                <span class="card-title">Alerts</span>
-                <button class="btn" onclick="clearAlerts()">Clear</button>
-            </div>
-            <div class="alert-list" id="alert-list">
-                <div class="empty-state">
-                    <div class="empty-state-icon">🔔</div>
-                    <div>No alerts</div>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Recent Requests Table -->
-        <div class="card">
-            <div class="card-header">
-                <span class="card-title">Recent Captures</span>
-                <select class="form-select" style="width: auto;" id="requests-limit" onchange="refreshRequests()">
-                    <option value="25">Last 25</option>
-                    <option value="50">Last 50</option>
-                    <option value="100">Last 100</option>
-                </select>
-            </div>
-            <div style="overflow-x: auto;">
-                <table class="requests-table">
-                    <thead>
-                        <tr>
-                            <th>Time</th>
-                            <th>Method</th>
-                            <th>Path</th>
-                            <th>Status</th>
-                            <th>Duration</th>
-                            <th>Type</th>
-                        </tr>
-                    </thead>
-                    <tbody id="requests-table-body">
-                        <tr>
-                            <td colspan="6" style="text-align: center; color: var(--text-muted);">No captures yet</td>
-                        </tr>
-                    </tbody>
-                </table>
-            </div>
-        </div>
-    </main>
-    
-    <script>
-        const API_BASE = window.location.pathname.replace(/\\/$/, '');
-        let refreshInterval;
-        
-        // State
-        let state = {
-            captureErrors: true,
-            captureSlow: true,
-            typeLimitsEnabled: false,
-            functionLimitsEnabled: false,
-        };
-        
-        // API calls
-        async function api(path, options = {}) {
-            const response = await fetch(API_BASE + '/api' + path, {
-                headers: { 'Content-Type': 'application/json' },
-                ...options,
-            });
-            return response.json();
-        }
-        
-        // Refresh all data
-        async function refreshAll() {
-            await Promise.all([
-                refreshStats(),
-                refreshTypeLimits(),
-                refreshFunctionLimits(),
-                refreshAlerts(),
-                refreshRequests(),
-                refreshEndpoints(),
-            ]);
-        }
-        
-        async function refreshStats() {
-            const data = await api('/stats');
-            
-            document.getElementById('total-captured').textContent = data.total_captured.toLocaleString();
-            document.getElementById('stat-errors').textContent = data.error_count.toLocaleString();
-            document.getElementById('stat-avg-duration').textContent = data.avg_duration_ms.toFixed(0) + 'ms';
-            document.getElementById('stat-error-rate').textContent = data.error_rate + '%';
-            document.getElementById('stat-strategy').textContent = data.sampling_stats?.strategy || 'random';
-            
-            // Update sampling form
-            if (data.sampling_stats) {
-                document.getElementById('sampling-strategy').value = data.sampling_stats.strategy;
-                document.getElementById('base-rate').value = data.sampling_stats.base_rate;
-            }
-        }
-        
-        async function refreshTypeLimits() {
-            const data = await api('/type-limits');
-            
-            state.typeLimitsEnabled = data.enabled;
-            updateToggle('toggle-type-limits', data.enabled);
-            
-            document.getElementById('type-limit-status').textContent = data.enabled ? 'Enabled' : 'Disabled';
-            document.getElementById('type-limit-status').className = 'card-badge ' + (data.enabled ? 'badge-active' : '');
-            
-            if (data.config) {
-                document.getElementById('type-field-path').value = data.config.field_path;
-                document.getElementById('limit-per-type').value = data.config.limit_per_type;
-                document.getElementById('limit-action').value = data.config.limit_action;
-            }
-            
-            // Update code example
-            updateCodeExample();
-            
-            // Render type counts
-            const typeList = document.getElementById('type-list');
-            const counts = data.counts || {};
-            const stoppedTypes = new Set(data.stopped_types || []);
-            const limit = data.config?.limit_per_type || 5000;
-            
-            if (Object.keys(counts).length === 0) {
-                typeList.innerHTML = '<div class="empty-state"><div class="empty-state-icon">📊</div><div>No type data yet</div></div>';
-            } else {
-                typeList.innerHTML = Object.entries(counts)
-                    .sort((a, b) => b[1] - a[1])
-                    .map(([type, count]) => {
-                        const percentage = Math.min((count / limit) * 100, 100);
-                        const isStopped = stoppedTypes.has(type);
-                        const progressClass = percentage >= 100 ? 'full' : percentage >= 75 ? 'high' : percentage >= 50 ? 'medium' : 'low';
-                        
-                        return `
-                            <div class="type-item">
-                                <div class="type-info">
-                                    <span class="type-name">${escapeHtml(type)}</span>
-                                    <span class="type-count">${count.toLocaleString()} / ${limit.toLocaleString()}</span>
-                                </div>
-                                <div style="display: flex; align-items: center; gap: 0.5rem;">
-                                    <span class="type-status ${isStopped ? 'stopped' : 'active'}">${isStopped ? 'Stopped' : 'Active'}</span>
-                                    <button class="btn" style="padding: 0.25rem 0.5rem; font-size: 0.75rem;" 
-                                            onclick="resetType('${escapeHtml(type)}')">Reset</button>
-                                </div>
-                            </div>
-                            <div class="progress-bar" style="margin-top: -0.25rem; margin-bottom: 0.5rem;">
-                                <div class="progress-fill ${progressClass}" style="width: ${percentage}%"></div>
-                            </div>
-                        `;
-                    }).join('');
-            }
-        }
-        
-        async function refreshFunctionLimits() {
-            const data = await api('/function-limits');
-            
-            state.functionLimitsEnabled = data.enabled;
-            updateToggle('toggle-function-limits', data.enabled);
-            
-            document.getElementById('function-limit-status').textContent = data.enabled ? 'Enabled' : 'Disabled';
-            document.getElementById('function-limit-status').className = 'card-badge ' + (data.enabled ? 'badge-active' : '');
-            
-            if (data.config) {
-                document.getElementById('function-limit-per-function').value = data.config.limit_per_function;
-                document.getElementById('function-limit-action').value = data.config.limit_action;
-            }
-            
-            // Render function counts
-            const functionList = document.getElementById('function-list');
-            const counts = data.counts || {};
-            const stoppedFunctions = new Set(data.stopped_functions || []);
-            const limit = data.config?.limit_per_function || 5000;
-            
-            if (Object.keys(counts).length === 0) {
-                functionList.innerHTML = '<div class="empty-state"><div class="empty-state-icon">📊</div><div>No function data yet</div></div>';
-            } else {
-                functionList.innerHTML = Object.entries(counts)
-                    .sort((a, b) => b[1] - a[1])
-                    .map(([func, count]) => {
-                        const percentage = Math.min((count / limit) * 100, 100);
-                        const isStopped = stoppedFunctions.has(func);
-                        const progressClass = percentage >= 100 ? 'full' : percentage >= 75 ? 'high' : percentage >= 50 ? 'medium' : 'low';
-                        
-                        return `
-                            <div class="type-item">
-                                <div class="type-info">
-                                    <span class="type-name">${escapeHtml(func)}</span>
-                                    <span class="type-count">${count.toLocaleString()} / ${limit.toLocaleString()}</span>
-                                </div>
-                                <div style="display: flex; align-items: center; gap: 0.5rem;">
-                                    <span class="type-status ${isStopped ? 'stopped' : 'active'}">${isStopped ? 'Stopped' : 'Active'}</span>
-                                    <button class="btn" style="padding: 0.25rem 0.5rem; font-size: 0.75rem;" 
-                                            onclick="resetFunction('${escapeHtml(func)}')">Reset</button>
-                                </div>
-                            </div>
-                            <div class="progress-bar" style="margin-top: -0.25rem; margin-bottom: 0.5rem;">
-                                <div class="progress-fill ${progressClass}" style="width: ${percentage}%"></div>
-                            </div>
-                        `;
-                    }).join('');
-            }
-        }
-        
-        async function refreshAlerts() {
-            const data = await api('/alerts');
-            const alertList = document.getElementById('alert-list');
-            
-            if (!data.alerts || data.alerts.length === 0) {
-                alertList.innerHTML = '<div class="empty-state"><div class="empty-state-icon">🔔</div><div>No alerts</div></div>';
-            } else {
-                alertList.innerHTML = data.alerts.map(alert => {
-                    const isFunctionAlert = alert.function_name !== undefined;
-                    const resetAction = isFunctionAlert ? 
-                        `<button class="btn alert-action" onclick="resetFunction('${escapeHtml(alert.function_name)}')">Resume</button>` :
-                        `<button class="btn alert-action" onclick="resetType('${escapeHtml(alert.type_value)}')">Resume</button>`;
-                    
-                    return `
-                        <div class="alert-item">
-                            <div class="alert-icon">⚠️</div>
-                            <div class="alert-content">
-                                <div class="alert-message">${escapeHtml(alert.message)}</div>
-                                <div class="alert-time">${new Date(alert.timestamp).toLocaleString()}</div>
-                            </div>
-                            ${resetAction}
-                        </div>
-                    `;
-                }).join('');
-            }
-        }
-        
-        async function refreshRequests() {
-            const limit = document.getElementById('requests-limit').value;
-            const data = await api('/requests?limit=' + limit);
-            const tbody = document.getElementById('requests-table-body');
-            
-            if (!data.requests || data.requests.length === 0) {
-                tbody.innerHTML = '<tr><td colspan="6" style="text-align: center; color: var(--text-muted);">No captures yet</td></tr>';
-            } else {
-                tbody.innerHTML = data.requests.map(req => {
-                    const methodClass = 'method-' + req.method.toLowerCase();
-                    const statusClass = req.status_code >= 500 ? 'status-5xx' : req.status_code >= 400 ? 'status-4xx' : 'status-2xx';
-                    const typeValue = extractType(req.request_body);
-                    
-                    return `
-                        <tr>
-                            <td>${new Date(req.timestamp).toLocaleTimeString()}</td>
-                            <td><span class="method ${methodClass}">${req.method}</span></td>
-                            <td style="max-width: 300px; overflow: hidden; text-overflow: ellipsis;">${escapeHtml(req.path)}</td>
-                            <td class="${statusClass}">${req.status_code || '-'}</td>
-                            <td>${req.duration_ms?.toFixed(0) || 0}ms</td>
-                            <td style="color: var(--accent-purple);">${typeValue ? escapeHtml(typeValue) : '-'}</td>
-                        </tr>
-                    `;
-                }).join('');
-            }
-        }
-        
-        function extractType(body) {
-            if (!body || typeof body !== 'object') return null;
-            const fieldPath = document.getElementById('type-field-path').value;
-            const parts = fieldPath.split('.');
-            let current = body;
-            for (const part of parts) {
-                if (current && typeof current === 'object' && part in current) {
-                    current = current[part];
-                } else {
-                    return null;
-                }
-            }
-            return current;
-        }
-        
-        // Settings updates
-        async function updateSamplingSettings() {
-            await api('/sampling', {
-                method: 'POST',
-                body: JSON.stringify({
-                    strategy: document.getElementById('sampling-strategy').value,
-                    base_rate: parseFloat(document.getElementById('base-rate').value),
-                    latency_threshold_ms: parseFloat(document.getElementById('latency-threshold').value),
-                    always_capture_errors: state.captureErrors,
-                    always_capture_slow: state.captureSlow,
-                }),
-            });
-            await refreshStats();
-        }
-        
-        function updateCodeExample() {
-            const fieldPath = document.getElementById('type-field-path').value;
-            const limitPerType = parseInt(document.getElementById('limit-per-type').value);
-            const limitAction = document.getElementById('limit-action').value;
-            const enabled = state.typeLimitsEnabled;
-            
-            const code = `from Chronicle.integrations import configure_type_limits, TypeLimitConfig
-
-configure_type_limits(TypeLimitConfig(
-    field_path="${fieldPath}",
-    limit_per_type=${limitPerType},
-    alert_on_limit=True,
-    limit_action="${limitAction}",
-))`;
-            
-            document.getElementById('type-limit-code-example').textContent = code;
-        }
-        
-        async function updateTypeLimitSettings() {
-            await api('/type-limits', {
-                method: 'POST',
-                body: JSON.stringify({
-                    enabled: state.typeLimitsEnabled,
-                    field_path: document.getElementById('type-field-path').value,
-                    limit_per_type: parseInt(document.getElementById('limit-per-type').value),
-                    limit_action: document.getElementById('limit-action').value,
-                }),
-            });
-            updateCodeExample();
-            await refreshTypeLimits();
-        }
-        
-        // Toggle functions
-        function updateToggle(id, active) {
-            const toggle = document.getElementById(id);
-            if (active) {
-                toggle.classList.add('active');
-            } else {
-                toggle.classList.remove('active');
-            }
-        }
-        
-        async function toggleErrors() {
-            state.captureErrors = !state.captureErrors;
-            updateToggle('toggle-errors', state.captureErrors);
-            await updateSamplingSettings();
-        }
-        
-        async function toggleSlow() {
-            state.captureSlow = !state.captureSlow;
-            updateToggle('toggle-slow', state.captureSlow);
-            await updateSamplingSettings();
-        }
-        
-        async function toggleTypeLimits() {
-            state.typeLimitsEnabled = !state.typeLimitsEnabled;
-            updateToggle('toggle-type-limits', state.typeLimitsEnabled);
-            await updateTypeLimitSettings();
-        }
-        
-        async function toggleFunctionLimits() {
-            state.functionLimitsEnabled = !state.functionLimitsEnabled;
-            updateToggle('toggle-function-limits', state.functionLimitsEnabled);
-            await updateFunctionLimitSettings();
-        }
-        
-        async function updateFunctionLimitSettings() {
-            await api('/function-limits', {
-                method: 'POST',
-                body: JSON.stringify({
-                    enabled: state.functionLimitsEnabled,
-                    limit_per_function: parseInt(document.getElementById('function-limit-per-function').value),
-                    limit_action: document.getElementById('function-limit-action').value,
-                }),
-            });
-            await refreshFunctionLimits();
-        }
-        
-        async function resetFunction(functionName) {
-            await api('/function-limits/reset/' + encodeURIComponent(functionName), { method: 'POST' });
-            await Promise.all([refreshFunctionLimits(), refreshAlerts()]);
-        }
-        
-        async function resetAllFunctions() {
-            if (confirm('Reset all function counts?')) {
-                await api('/function-limits/reset-all', { method: 'POST' });
-                await Promise.all([refreshFunctionLimits(), refreshAlerts()]);
-            }
-        }
-        
-        // Actions
-        async function clearCaptures() {
-            if (confirm('Clear all captured requests?')) {
-                await api('/clear', { method: 'POST' });
-                await refreshAll();
-            }
-        }
-        
-        async function clearAlerts() {
-            await api('/alerts/clear', { method: 'POST' });
-            await refreshAlerts();
-        }
-        
-        async function resetType(typeValue) {
-            await api('/type-limits/reset/' + encodeURIComponent(typeValue), { method: 'POST' });
-            await Promise.all([refreshTypeLimits(), refreshAlerts()]);
-        }
-        
-        async function resetAllTypes() {
-            if (confirm('Reset all type counts?')) {
-                await api('/type-limits/reset-all', { method: 'POST' });
-                await Promise.all([refreshTypeLimits(), refreshAlerts()]);
-            }
-        }
-        
-        // Endpoint management
-        let allEndpoints = [];
-        
-        async function refreshEndpoints() {
-            const data = await api('/endpoints');
-            allEndpoints = data.endpoints || [];
-            renderEndpoints();
-        }
-        
-        function filterEndpoints() {
-            renderEndpoints();
-        }
-        
-        function renderEndpoints() {
-            const filter = document.getElementById('endpoint-filter').value.toLowerCase();
-            const filtered = allEndpoints.filter(ep => 
-                ep.path.toLowerCase().includes(filter) || 
-                ep.method.toLowerCase().includes(filter)
-            );
-            
-            const endpointList = document.getElementById('endpoint-list');
-            
-            if (filtered.length === 0) {
-                endpointList.innerHTML = '<div class="empty-state"><div class="empty-state-icon">🔍</div><div>No endpoints found</div></div>';
-                return;
-            }
-            
-            endpointList.innerHTML = filtered.map(ep => {
-                const methodClass = 'method-' + ep.method.toLowerCase();
-                const configBadge = ep.has_custom_config ? 
-                    '<span class="type-status active" style="margin-left: 0.5rem;">Custom</span>' : 
-                    '<span class="type-status" style="margin-left: 0.5rem; background: rgba(139, 149, 165, 0.15); color: var(--text-muted);">Global</span>';
-                
-                const config = ep.config;
-                const configDisplay = config ? `
-                    <div style="margin-top: 0.5rem; font-size: 0.75rem; color: var(--text-muted);">
-                        Field: <code style="color: var(--accent-cyan);">${escapeHtml(config.field_path)}</code> | 
-                        Limit: <code style="color: var(--accent-cyan);">${config.limit_per_type}</code> | 
-                        Action: <code style="color: var(--accent-cyan);">${config.limit_action}</code>
-                    </div>
-                ` : '<div style="margin-top: 0.5rem; font-size: 0.75rem; color: var(--text-muted);">Type limits disabled</div>';
-                
-                return `
-                    <div class="endpoint-config" style="margin-bottom: 1rem;">
-                        <div class="endpoint-header">
-                            <div style="display: flex; align-items: center; gap: 0.75rem;">
-                                <span class="method ${methodClass}">${ep.method}</span>
-                                <span class="endpoint-path">${escapeHtml(ep.path)}</span>
-                                ${configBadge}
-                            </div>
-                            <div style="display: flex; align-items: center; gap: 0.5rem;">
-                                <span style="font-size: 0.75rem; color: var(--text-muted);">${ep.capture_count} captures</span>
-                                ${ep.has_custom_config ? 
-                                    `<button class="btn" style="padding: 0.25rem 0.5rem; font-size: 0.75rem;" onclick="removeEndpointConfig('${escapeHtml(ep.path)}')">Remove Custom</button>` :
-                                    `<button class="btn" style="padding: 0.25rem 0.5rem; font-size: 0.75rem;" onclick="showEndpointConfig('${escapeHtml(ep.path)}', '${ep.method}')">Set Custom</button>`
-                                }
-                            </div>
-                        </div>
-                        ${configDisplay}
-                    </div>
-                `;
-            }).join('');
-        }
-        
-        async function showEndpointConfig(path, method) {
-            // Get current global config
-            const typeLimitsData = await api('/type-limits');
-            const globalConfig = typeLimitsData.config || {
-                field_path: 'type',
-                limit_per_type: 5000,
-                limit_action: 'stop',
-            };
-            
-            const fieldPath = prompt('Field Path (e.g., "type", "payload.type"):', globalConfig.field_path);
-            if (fieldPath === null) return;
-            
-            const limitPerType = prompt('Limit Per Type:', globalConfig.limit_per_type);
-            if (limitPerType === null) return;
-            
-            const limitAction = confirm('Stop recording when limit reached? (OK = Stop, Cancel = Sample at low rate)') ? 'stop' : 'sample';
-            
-            await setEndpointConfig(path, {
-                field_path: fieldPath,
-                limit_per_type: parseInt(limitPerType),
-                limit_action: limitAction,
-            });
-        }
-        
-        async function setEndpointConfig(path, config) {
-            await api('/endpoints/' + encodeURIComponent(path) + '/config', {
-                method: 'POST',
-                body: JSON.stringify(config),
-            });
-            await Promise.all([refreshEndpoints(), refreshTypeLimits()]);
-        }
-        
-        async function removeEndpointConfig(path) {
-            if (confirm(`Remove custom configuration for ${path}?`)) {
-                await api('/endpoints/' + encodeURIComponent(path) + '/config', { method: 'DELETE' });
-                await Promise.all([refreshEndpoints(), refreshTypeLimits()]);
-            }
-        }
-        
-        // Utility
-        function escapeHtml(str) {
-            if (str === null || str === undefined) return '';
-            return String(str)
-                .replace(/&/g, '&amp;')
-                .replace(/</g, '&lt;')
-                .replace(/>/g, '&gt;')
-                .replace(/"/g, '&quot;');
-        }
-        
-        // Initialize
-        updateToggle('toggle-errors', state.captureErrors);
-        updateToggle('toggle-slow', state.captureSlow);
-        
-        // Add event listeners to update code example in real-time
-        document.getElementById('type-field-path').addEventListener('input', updateCodeExample);
-        document.getElementById('limit-per-type').addEventListener('input', updateCodeExample);
-        document.getElementById('limit-action').addEventListener('change', updateCodeExample);
-        
-        refreshAll();
-        refreshInterval = setInterval(refreshAll, 5000);
-    </script>
-</body>
-</html>
-'''
+# The dashboard shell lives in dashboard.html next to this module and is
+# read once at import as bytes - no multi-kilobyte string literal to
+# parse on import and no str form to re-encode per response
+_DASHBOARD_HTML_PATH = Path(__file__).with_name("dashboard.html")
+DASHBOARD_HTML_BYTES = _DASHBOARD_HTML_PATH.read_bytes()
+
+# The shell is a module constant, so the compressed variants and ETag are
+# computed once here; per-hit work is a couple of header checks.
+_DASHBOARD_HTML_GZIP = gzip.compress(DASHBOARD_HTML_BYTES, 9)
+_DASHBOARD_HTML_BR = (
+    brotli.compress(DASHBOARD_HTML_BYTES, quality=11) if brotli is not None else None
+)
+_DASHBOARD_HTML_ETAG = '"' + hashlib.sha256(DASHBOARD_HTML_BYTES).hexdigest()[:16] + '"'
+
+_HTML_MEDIA_TYPE = "text/html; charset=utf-8"
+
+
+def _dashboard_response(request: Optional[Request] = None) -> Response:
+    """
+    Serve the pre-encoded dashboard HTML.
+
+    no-cache plus a stable ETag lets refreshes revalidate with a 304
+    while a redeployed shell still shows up immediately; the body is
+    picked from the precompressed variants by Accept-Encoding.
+    """
+    headers = {"ETag": _DASHBOARD_HTML_ETAG, "Cache-Control": "no-cache"}
+    if request is not None:
+        if request.headers.get("if-none-match") == _DASHBOARD_HTML_ETAG:
+            return Response(status_code=304, headers=headers)
+        accept = request.headers.get("accept-encoding", "")
+        if _DASHBOARD_HTML_BR is not None and "br" in accept:
+            headers["Content-Encoding"] = "br"
+            return Response(content=_DASHBOARD_HTML_BR, media_type=_HTML_MEDIA_TYPE, headers=headers)
+        if "gzip" in accept:
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=_DASHBOARD_HTML_GZIP, media_type=_HTML_MEDIA_TYPE, headers=headers)
+    return Response(
+        content=DASHBOARD_HTML_BYTES,
+        media_type=_HTML_MEDIA_TYPE,
+        headers=headers,
+    )
+
+
+def _merged_alerts(limit: int = 100) -> List[Dict[str, Any]]:
+    """Merge recent alerts from both limiters, newest first."""
+    # Each limiter already emits newest-first, so a two-way merge takes the
+    # top `limit` in O(limit) comparisons with no concatenated intermediate
+    merged = merge(
+        get_type_limiter().get_alerts(limit),
+        get_function_limiter().get_alerts(limit),
+        key=lambda x: x.get("timestamp", ""),
+        reverse=True,
+    )
+    return list(islice(merged, limit))
+
+
+# Memoized endpoint summary payload; the key captures every input the
+# summary depends on so steady-state polls return the cached list
+_endpoints_cache: Dict[str, Any] = {"key": None, "payload": None}
+
+
+def _endpoint_summaries() -> List[Dict[str, Any]]:
+    """Summarize captured endpoints with their type-limit configuration."""
+    limiter = get_type_limiter()
+    # The store keeps per-endpoint counts incrementally, so the summary is
+    # O(unique endpoints) and can be memoized until something changes: the
+    # latest seq moves on every store (len alone stalls once eviction kicks
+    # in) and _config_rev moves on every limiter mutation
+    last_seq = _captured_requests[-1].seq if _captured_requests else 0
+    key = (last_seq, len(_captured_requests), limiter._config_rev, limiter._enabled)
+    if _endpoints_cache["key"] == key:
+        return _endpoints_cache["payload"]
+
+    endpoint_list = []
+    for method, endpoint_path in sorted(_endpoint_counts):
+        # Check if this endpoint has custom config
+        has_custom = endpoint_path in limiter._endpoints
+        custom_config = limiter._endpoints.get(endpoint_path)
+
+        endpoint_list.append({
+            "method": method,
+            "path": endpoint_path,
+            "key": f"{method} {endpoint_path}",
+            "capture_count": _endpoint_counts[(method, endpoint_path)],
+            "has_custom_config": has_custom,
+            "config": {
+                "field_path": custom_config.field_path if custom_config else limiter.config.field_path,
+                "limit_per_type": custom_config.limit_per_type if custom_config else limiter.config.limit_per_type,
+                "limit_action": custom_config.limit_action if custom_config else limiter.config.limit_action,
+            } if limiter._enabled else None,
+        })
+
+    _endpoints_cache["key"] = key
+    _endpoints_cache["payload"] = endpoint_list
+    return endpoint_list
+
+
+def _resolve_type_field(body: Any, parts: tuple) -> Optional[str]:
+    """Walk a dotted field path inside a captured request body."""
+    current = body
+    for part in parts:
+        if isinstance(current, dict) and part in current:
+            current = current[part]
+        else:
+            return None
+    return str(current) if current is not None else None
+
+
+def _request_row(r: Any, parts: tuple) -> Dict[str, Any]:
+    """
+    Projection of a capture for the Recent Captures table.
+
+    Ships only the columns the table renders, with the type field already
+    resolved server-side - request_body and response_body stay on the
+    server until the detail endpoint asks for them.
+    """
+    return {
+        "seq": r.seq,
+        "id": r.id,
+        "timestamp": datetime.fromtimestamp(r.timestamp, tz=timezone.utc).isoformat(),
+        "method": r.method,
+        "path": r.path,
+        "status_code": r.status_code,
+        "duration_ms": r.duration_ms,
+        "type": _resolve_type_field(r.request_body, parts),
+    }
+
+
+# Registered at most once with the capture store, regardless of how many
+# routers are created
+_capture_event_hook_installed = False
+
+
+def _notify_request_captured(captured: Any) -> None:
+    """Capture-store callback: push new captures to SSE subscribers."""
+    if _event_broadcaster.active:
+        parts = get_type_limiter().config._path_parts
+        _event_broadcaster.publish("requests", _request_row(captured, parts))
 
 
 def create_chronicle_router() -> APIRouter:
     """Create the API router for the Chronicle dashboard."""
-    router = APIRouter()
+    global _capture_event_hook_installed
+    router = APIRouter(default_response_class=_DashboardJSONResponse)
+
+    if not _capture_event_hook_installed:
+        add_capture_callback(_notify_request_captured)
+        _capture_event_hook_installed = True
     
     @router.get("/", response_class=HTMLResponse)
-    async def dashboard():
+    async def dashboard(request: Request):
         """Serve the dashboard HTML."""
-        return HTMLResponse(content=DASHBOARD_HTML)
+        return _dashboard_response(request)
     
     @router.get("/api/stats")
-    async def get_stats():
+    async def get_stats(request: Request):
         """Get capture statistics."""
-        return get_capture_stats()
-    
+        return _json_response(get_capture_stats(), request)
+
+    @router.get("/api/summary")
+    @router.get("/api/dashboard")
+    async def get_dashboard_data(request: Request, limit: int = 25, fields: Optional[str] = None):
+        """
+        Bulk snapshot of every dashboard panel in one response.
+
+        The dashboard's auto-refresh hits this instead of six separate
+        endpoints, cutting round-trips 6x and giving a coherent
+        point-in-time snapshot with no inter-call skew. Exposed as both
+        /api/dashboard and /api/summary. A comma-separated `fields` query
+        narrows the payload to just the panels a user action touched, so
+        post-action refreshes only compute the affected slices.
+        """
+        wanted = frozenset(fields.split(",")) if fields else None
+
+        def want(key: str) -> bool:
+            return wanted is None or key in wanted
+
+        payload: Dict[str, Any] = {}
+        if want("stats"):
+            payload["stats"] = get_capture_stats()
+        if want("type_limits"):
+            payload["type_limits"] = get_type_limiter().get_stats()
+        if want("function_limits"):
+            payload["function_limits"] = get_function_limiter().get_stats()
+        if want("alerts"):
+            payload["alerts"] = {"alerts": _merged_alerts()}
+        if want("requests"):
+            payload["requests"] = {
+                "requests": [
+                    _request_row(r, get_type_limiter().config._path_parts)
+                    for r in get_captured_requests(limit=limit)
+                ],
+                "total": len(_captured_requests),
+            }
+        if want("endpoints"):
+            payload["endpoints"] = {"endpoints": _endpoint_summaries()}
+        return _json_response(payload, request)
+
     @router.get("/api/requests")
-    async def get_requests(limit: int = 25):
-        """Get recent captured requests."""
+    async def get_requests(limit: int = 25, since: int = 0, type_field: str = ""):
+        """
+        Stream recent captured requests as NDJSON row projections.
+
+        The first line carries {"total": N, "cursor": C}; every following
+        line is one capture projected to the columns the table renders,
+        with ``type_field`` (defaulting to the type limiter's configured
+        path) resolved server-side - full bodies never leave the server
+        on this route. Streaming line-by-line lets the dashboard render
+        rows as each one parses, and passing the previous cursor as
+        ``since`` returns only rows stored after it, so a steady-state
+        refresh ships the delta (often nothing) rather than the window.
+        """
         requests = get_captured_requests(limit=limit)
-        return {
-            "requests": [r.to_dict() for r in requests],
-            "total": len(_captured_requests),
-        }
-    
+        if since:
+            requests = [r for r in requests if r.seq > since]
+        total = len(_captured_requests)
+        cursor = _captured_requests[-1].seq if _captured_requests else 0
+        parts = tuple(type_field.split(".")) if type_field else get_type_limiter().config._path_parts
+
+        # Rows are positional arrays with an incremental string table for
+        # the repetitive columns (method, path, type): the first occurrence
+        # of a value is sent as the string itself and implicitly appended
+        # to the table, repeats are sent as its integer index. The client
+        # mirrors the same table in the same order, so interning survives
+        # line-by-line streaming.
+        table: Dict[str, int] = {}
+
+        def ref(value):
+            if not isinstance(value, str):
+                return value
+            idx = table.get(value)
+            if idx is not None:
+                return idx
+            table[value] = len(table)
+            return value
+
+        def lines():
+            yield _ndjson_line({"total": total, "cursor": cursor})
+            for r in requests:
+                row = _request_row(r, parts)
+                yield _ndjson_line([
+                    row["seq"],
+                    row["id"],
+                    row["timestamp"],
+                    ref(row["method"]),
+                    ref(row["path"]),
+                    row["status_code"],
+                    row["duration_ms"],
+                    ref(row["type"]),
+                ])
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    @router.get("/api/requests/{request_id}")
+    async def get_request_detail(request_id: str):
+        """Full capture, bodies included, for detail-on-demand."""
+        for r in reversed(_captured_requests):
+            if r.id == request_id:
+                return _json_response(r.to_dict())
+        raise HTTPException(status_code=404, detail="Request not found")
+    
+    @router.get("/api/events")
+    async def event_stream():
+        """
+        Server-Sent Events stream of dashboard mutations.
+
+        Pushes requests/alert/limit_changed/stats events as they happen
+        so connected dashboards don't need to poll.
+        """
+        queue = _event_broadcaster.subscribe()
+
+        async def stream():
+            try:
+                while True:
+                    yield await queue.get()
+            finally:
+                _event_broadcaster.unsubscribe(queue)
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
     @router.post("/api/clear")
     async def clear_all():
         """Clear all captured requests."""
         count = clear_captured_requests()
-        return {"cleared": count}
+        _event_broadcaster.publish("stats", get_capture_stats())
+        return _json_response({"cleared": count})
     
     @router.get("/api/sampling")
     async def get_sampling():
         """Get current sampling configuration."""
+        global _sampling_config_cache
         sampler = get_sampler()
-        return {
-            "config": {
-                "strategy": sampler.config.strategy.value,
-                "base_rate": sampler.config.base_rate,
-                "always_capture_errors": sampler.config.always_capture_errors,
-                "always_capture_slow": sampler.config.always_capture_slow,
-                "latency_threshold_ms": sampler.config.latency_threshold_ms,
-                "head_count": sampler.config.head_count,
-                "max_patterns_per_endpoint": sampler.config.max_patterns_per_endpoint,
-            },
+        version = get_sampler_version()
+        if _sampling_config_cache[0] != version:
+            config = sampler.config
+            _sampling_config_cache = (version, {
+                "strategy": config.strategy.value,
+                "base_rate": config.base_rate,
+                "always_capture_errors": config.always_capture_errors,
+                "always_capture_slow": config.always_capture_slow,
+                "latency_threshold_ms": config.latency_threshold_ms,
+                "head_count": config.head_count,
+                "max_patterns_per_endpoint": config.max_patterns_per_endpoint,
+            })
+        return _json_response({
+            "config": _sampling_config_cache[1],
             "stats": sampler.get_stats(),
-        }
+        })
     
     @router.post("/api/sampling")
     async def update_sampling(request: Request):
         """Update sampling configuration."""
-        data = await request.json()
+        data = await _request_json(request)
         
         # Get current sampler config as base
         current = get_sampler().config
@@ -1852,18 +1418,38 @@ def create_chronicle_router() -> APIRouter:
         )
         
         configure_sampling(new_config)
-        return {"success": True, "config": new_config.__dict__}
+        _event_broadcaster.publish("limit_changed", {})
+        return _json_response({"success": True, "config": {
+            "strategy": new_config.strategy.value,
+            "base_rate": new_config.base_rate,
+            "always_capture_errors": new_config.always_capture_errors,
+            "always_capture_slow": new_config.always_capture_slow,
+            "latency_threshold_ms": new_config.latency_threshold_ms,
+            "head_count": new_config.head_count,
+            "max_patterns_per_endpoint": new_config.max_patterns_per_endpoint,
+        }})
+
+    @router.post("/api/sampling/toggle/{field}/{value}")
+    async def toggle_sampling_flag(field: str, value: bool):
+        """Flip a single sampling boolean without parsing a JSON body."""
+        if field not in ("always_capture_errors", "always_capture_slow"):
+            raise HTTPException(status_code=400, detail=f"Unknown sampling flag: {field}")
+        configure_sampling(replace(get_sampler().config, **{field: value}))
+        _event_broadcaster.publish("limit_changed", {})
+        return _json_response({"success": True, field: value})
     
     @router.get("/api/type-limits")
-    async def get_type_limits():
+    async def get_type_limits(request: Request, detail: str = "full"):
         """Get type limiting configuration and state."""
         limiter = get_type_limiter()
-        return limiter.get_stats()
+        if detail == "summary":
+            return _json_response(limiter.get_stats_summary())
+        return _limiter_stats_response(limiter, request)
     
     @router.post("/api/type-limits")
     async def update_type_limits(request: Request):
         """Update type limiting configuration."""
-        data = await request.json()
+        data = await _request_json(request)
         limiter = get_type_limiter()
         
         if "enabled" in data:
@@ -1881,33 +1467,38 @@ def create_chronicle_router() -> APIRouter:
             overflow_sample_rate=data.get("overflow_sample_rate", limiter.config.overflow_sample_rate),
         )
         limiter.set_config(config)
-        
-        return {"success": True}
+        _event_broadcaster.publish("limit_changed", {})
+
+        return _json_response({"success": True})
     
     @router.post("/api/type-limits/reset/{type_value:path}")
     async def reset_type(type_value: str):
         """Reset count for a specific type."""
         limiter = get_type_limiter()
         limiter.reset_type(type_value)
-        return {"success": True, "reset": type_value}
+        _event_broadcaster.publish("limit_changed", {})
+        return _json_response({"success": True, "reset": type_value})
     
     @router.post("/api/type-limits/reset-all")
     async def reset_all_types():
         """Reset all type counts."""
         limiter = get_type_limiter()
         limiter.reset_all()
-        return {"success": True}
+        _event_broadcaster.publish("limit_changed", {})
+        return _json_response({"success": True})
     
     @router.get("/api/function-limits")
-    async def get_function_limits():
+    async def get_function_limits(request: Request, detail: str = "full"):
         """Get function limiting configuration and state."""
         limiter = get_function_limiter()
-        return limiter.get_stats()
+        if detail == "summary":
+            return _json_response(limiter.get_stats_summary())
+        return _limiter_stats_response(limiter, request)
     
     @router.post("/api/function-limits")
     async def update_function_limits(request: Request):
         """Update function limiting configuration."""
-        data = await request.json()
+        data = await _request_json(request)
         limiter = get_function_limiter()
         
         if "enabled" in data:
@@ -1924,37 +1515,30 @@ def create_chronicle_router() -> APIRouter:
             overflow_sample_rate=data.get("overflow_sample_rate", limiter.config.overflow_sample_rate),
         )
         limiter.set_config(config)
-        
-        return {"success": True}
+        _event_broadcaster.publish("limit_changed", {})
+
+        return _json_response({"success": True})
     
     @router.post("/api/function-limits/reset/{function_name:path}")
     async def reset_function(function_name: str):
         """Reset count for a specific function."""
         limiter = get_function_limiter()
         limiter.reset_function(function_name)
-        return {"success": True, "reset": function_name}
+        _event_broadcaster.publish("limit_changed", {})
+        return _json_response({"success": True, "reset": function_name})
     
     @router.post("/api/function-limits/reset-all")
     async def reset_all_functions():
         """Reset all function counts."""
         limiter = get_function_limiter()
         limiter.reset_all()
-        return {"success": True}
+        _event_broadcaster.publish("limit_changed", {})
+        return _json_response({"success": True})
     
     @router.get("/api/alerts")
     async def get_alerts(limit: int = 100):
         """Get recent alerts from both type and function limiters."""
-        type_limiter = get_type_limiter()
-        function_limiter = get_function_limiter()
-        
-        type_alerts = type_limiter.get_alerts(limit)
-        function_alerts = function_limiter.get_alerts(limit)
-        
-        # Combine and sort by timestamp
-        all_alerts = type_alerts + function_alerts
-        all_alerts.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-        
-        return {"alerts": all_alerts[:limit]}
+        return _json_response({"alerts": _merged_alerts(limit)})
     
     @router.post("/api/alerts/clear")
     async def clear_alerts():
@@ -1962,53 +1546,17 @@ def create_chronicle_router() -> APIRouter:
         type_limiter = get_type_limiter()
         function_limiter = get_function_limiter()
         count = type_limiter.clear_alerts() + function_limiter.clear_alerts()
-        return {"cleared": count}
+        return _json_response({"cleared": count})
     
     @router.get("/api/endpoints")
-    async def get_endpoints():
+    async def get_endpoints(request: Request):
         """Get all captured endpoints with their configuration."""
-        from .fastapi import _captured_requests
-        
-        # Get unique endpoints from captured requests
-        endpoints = {}
-        for req in _captured_requests:
-            endpoint_key = f"{req.method} {req.path}"
-            if endpoint_key not in endpoints:
-                endpoints[endpoint_key] = {
-                    "method": req.method,
-                    "path": req.path,
-                    "count": 0,
-                }
-            endpoints[endpoint_key]["count"] += 1
-        
-        # Get type limiter config for each endpoint
-        limiter = get_type_limiter()
-        endpoint_list = []
-        for key, info in sorted(endpoints.items()):
-            endpoint_path = info["path"]
-            # Check if this endpoint has custom config
-            has_custom = endpoint_path in limiter._endpoints
-            custom_config = limiter._endpoints.get(endpoint_path)
-            
-            endpoint_list.append({
-                "method": info["method"],
-                "path": endpoint_path,
-                "key": key,
-                "capture_count": info["count"],
-                "has_custom_config": has_custom,
-                "config": {
-                    "field_path": custom_config.field_path if custom_config else limiter.config.field_path,
-                    "limit_per_type": custom_config.limit_per_type if custom_config else limiter.config.limit_per_type,
-                    "limit_action": custom_config.limit_action if custom_config else limiter.config.limit_action,
-                } if limiter._enabled else None,
-            })
-        
-        return {"endpoints": endpoint_list}
+        return _etag_json_response(request, _json_bytes({"endpoints": _endpoint_summaries()}))
     
     @router.post("/api/endpoints/{endpoint_path:path}/config")
     async def set_endpoint_config(endpoint_path: str, request: Request):
         """Set custom type limit configuration for a specific endpoint."""
-        data = await request.json()
+        data = await _request_json(request)
         limiter = get_type_limiter()
         
         # Create custom config for this endpoint
@@ -2022,15 +1570,17 @@ def create_chronicle_router() -> APIRouter:
         
         limiter.set_config(config, endpoint=endpoint_path)
         limiter.enable(endpoint=endpoint_path, config=config)
-        
-        return {"success": True, "endpoint": endpoint_path, "config": config.__dict__}
+        _event_broadcaster.publish("limit_changed", {})
+
+        return _json_response({"success": True, "endpoint": endpoint_path, "config": config.__dict__})
     
     @router.delete("/api/endpoints/{endpoint_path:path}/config")
     async def remove_endpoint_config(endpoint_path: str):
         """Remove custom configuration for an endpoint (revert to global)."""
         limiter = get_type_limiter()
         limiter.disable(endpoint=endpoint_path)
-        return {"success": True, "endpoint": endpoint_path}
+        _event_broadcaster.publish("limit_changed", {})
+        return _json_response({"success": True, "endpoint": endpoint_path})
     
     return router
 
@@ -2071,25 +1621,17 @@ def mount_chronicle_dashboard(
         return None
     
     router = create_chronicle_router()
-    
-    # Wrap with auth if provided
+
+    # Enforce auth as a router-level dependency so Starlette's normal route
+    # dispatch still applies - no per-request scan over the route table
+    dependencies = []
     if auth_callback:
-        original_routes = router.routes.copy()
-        router = APIRouter()
-        
-        @router.api_route("/{path:path}", methods=["GET", "POST", "PUT", "DELETE"])
-        async def auth_wrapper(request: Request, path: str = ""):
+        def _auth_dep(request: Request) -> None:
             if not auth_callback(request):
                 raise HTTPException(status_code=401, detail="Unauthorized")
-            # Continue to actual route
-            for route in original_routes:
-                if hasattr(route, "path") and route.matches(request.scope)[0]:
-                    return await route.endpoint(request)
-            raise HTTPException(status_code=404, detail="Not found")
-        
-        # Simpler approach: add middleware to router
-        router = create_chronicle_router()
-    
+
+        dependencies.append(Depends(_auth_dep))
+
     # Ensure path doesn't have trailing slash for prefix
     prefix = path.rstrip("/")
     
@@ -2103,17 +1645,20 @@ def mount_chronicle_dashboard(
         # Also add with trailing slash for explicit matching
         if not prefix.endswith("/"):
             sampler.config.never_capture_endpoints.add(f"{prefix}/")
+        # The sets were mutated in place, so recompile the prefix matchers
+        sampler.config.rebuild_endpoint_matchers()
     
     # Mount the router (routes will be at prefix + router path, e.g., /chronicle/ and /chronicle/api/stats)
-    app.include_router(router, prefix=prefix, tags=["chronicle"])
-    
+    app.include_router(router, prefix=prefix, dependencies=dependencies, tags=["chronicle"])
+
     # Also handle the path without trailing slash by serving the dashboard directly
     # This ensures /_chronicle works in addition to /_chronicle/
     if prefix:
-        @app.get(prefix, response_class=HTMLResponse, include_in_schema=False)
-        async def dashboard_no_slash():
+        @app.get(prefix, response_class=HTMLResponse, include_in_schema=False,
+                 dependencies=dependencies)
+        async def dashboard_no_slash(request: Request):
             """Serve dashboard at the prefix (without trailing slash)."""
-            return HTMLResponse(content=DASHBOARD_HTML)
+            return _dashboard_response(request)
         
         # If prefix starts with /_, also add a redirect from the version without _
         if prefix.startswith("/_"):